@@ -4,333 +4,780 @@ Provides HTTP and WebSocket endpoints for computer use agents to call consolidat
 """
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import Dict, Any, List, Optional
-import json
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel, ConfigDict
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple, Union
+from importlib import import_module
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import lru_cache, partial
+from collections import ChainMap, OrderedDict
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from time import monotonic, perf_counter_ns
 import asyncio
+import os
+import sys
+import threading
+import orjson
 import uvicorn
 
-# Import consolidated tool modules
-from que_core.tools import (
-    system_tools, context_tools, automation_tools, file_tools, app_tools, 
-    shell_tools, network_tools, settings_tools, dev_tools, security_tools, 
-    audio_tools, vision_tools, document_tools, data_tools
-)
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Shut the tool executors down when the worker stops"""
+    yield
+    for pool in TOOL_POOLS.values():
+        pool.shutdown(wait=False)
 
 app = FastAPI(
     title="QUE CORE API",
     description="Consolidated tool-calling API for computer use AI agents",
-    version="0.1.0"
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan
 )
 
-# Enable CORS for web clients
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Executors for blocking (sync) tools, partitioned so slow tools cannot starve fast ones:
+# "io" for quick file/network/UI calls, "subproc" for tools that shell out,
+# "cpu" for data and document crunching. All are thread pools, which start
+# threads on demand: every uvicorn worker imports this module, and data and
+# document tools keep module state and take arguments a process pool would
+# have to pickle
+TOOL_POOLS: Dict[str, Executor] = {
+    "io": ThreadPoolExecutor(max_workers=64, thread_name_prefix="que-io"),
+    "subproc": ThreadPoolExecutor(max_workers=8, thread_name_prefix="que-subproc"),
+    "cpu": ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="que-cpu"),
+}
+
+# Pool per tool module; tools from unlisted modules run in the "io" pool
+_MODULE_POOLS = {
+    "shell_tools": "subproc",
+    "dev_tools": "subproc",
+    "data_tools": "cpu",
+    "document_tools": "cpu",
+}
+
+# Seconds an idle client connection is kept open for reuse
+KEEP_ALIVE_TIMEOUT = int(os.getenv("QUE_KEEP_ALIVE", "75"))
+
+# Maximum tool calls executing at once in this worker; beyond it requests get 503
+MAX_INFLIGHT = int(os.getenv("QUE_MAX_INFLIGHT", "64"))
+
+# Maximum concurrent tool calls per WebSocket connection
+WS_MAX_IN_FLIGHT = 32
+
+# Response coalescing for WebSocket clients connected with ?batch=1
+WS_BATCH_WINDOW = 0.001  # seconds
+WS_BATCH_MAX = 32
+
+# Enable CORS for web clients; agent-only deployments skip the middleware entirely
+if os.getenv("QUE_ENABLE_CORS") == "1":
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+class _LazyTool:
+    """Registry entry that imports its que_core.tools module on first call
+    
+    Tool modules pull in heavy dependencies (cv2, pandas, PIL, ...), so they are
+    only loaded once a tool from them is actually used. The resolved function
+    is cached on the entry.
+    """
+    __slots__ = ("module", "attr", "_fn")
+    
+    def __init__(self, module: str, attr: str):
+        self.module = module
+        self.attr = attr
+        self._fn = None
+    
+    def resolve(self) -> Callable:
+        if self._fn is None:
+            self._fn = getattr(import_module(f"que_core.tools.{self.module}"), self.attr)
+        return self._fn
+    
+    def __call__(self, **kwargs):
+        return self.resolve()(**kwargs)
+
+def _ttl_cached(tool_function: Callable, ttl: float = 5.0, maxsize: int = 256) -> Callable:
+    """Memoize a read-only tool's successful results per args for ttl seconds
+    
+    Holds at most maxsize entries: when full, expired entries are dropped
+    first, then the least recently used. Callers get a shallow copy of the
+    stored result dict, so changing a response's keys can't alter later hits.
+    """
+    cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+    # Sync tools run concurrently in executor threads
+    lock = threading.Lock()
+    
+    def wrapper(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
+        key = orjson.dumps(args, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        now = monotonic()
+        with lock:
+            hit = cache.get(key)
+            if hit is not None:
+                if now - hit[0] < ttl:
+                    cache.move_to_end(key)
+                    return dict(hit[1])
+                del cache[key]
+        
+        result = tool_function(args=args)
+        if result.get("success"):
+            with lock:
+                if len(cache) >= maxsize:
+                    for stale in [k for k, (stored_at, _) in cache.items() if now - stored_at >= ttl]:
+                        del cache[stale]
+                    while len(cache) >= maxsize:
+                        cache.popitem(last=False)
+                cache[key] = (now, dict(result))
+        return result
+    
+    return wrapper
 
 # Consolidated Tool Registry - maps tool names to consolidated functions
 CONSOLIDATED_TOOLS = {
     # System tools (3 consolidated tools)
-    "system_query": system_tools.system_query,
-    "system_control": system_tools.system_control,
-    "process_manager": system_tools.process_manager,
+    "system_query": _LazyTool("system_tools", "system_query"),
+    "system_control": _LazyTool("system_tools", "system_control"),
+    "process_manager": _LazyTool("system_tools", "process_manager"),
     
     # App & Window Control (2 consolidated tools)
-    "app_manager": app_tools.app_manager,
-    "window_control": app_tools.window_control,
+    "app_manager": _LazyTool("app_tools", "app_manager"),
+    "window_control": _LazyTool("app_tools", "window_control"),
     
     # File System (2 consolidated tools)
-    "file_manager": file_tools.file_manager,
-    "file_search": file_tools.file_search,
+    "file_manager": _LazyTool("file_tools", "file_manager"),
+    "file_search": _LazyTool("file_tools", "file_search"),
     
     # Network & Web (3 consolidated tools)
-    "network_tools": network_tools.network_tools,
-    "web_browser": network_tools.web_browser,
-    "auto_web_search": network_tools.auto_web_search,
+    "network_tools": _LazyTool("network_tools", "network_tools"),
+    "web_browser": _LazyTool("network_tools", "web_browser"),
+    "auto_web_search": _LazyTool("network_tools", "auto_web_search"),
     
     # Shell & Commands (2 consolidated tools)
-    "shell_execute": shell_tools.shell_execute,
-    "environment_manager": shell_tools.environment_manager,
+    "shell_execute": _LazyTool("shell_tools", "shell_execute"),
+    "environment_manager": _LazyTool("shell_tools", "environment_manager"),
     
     # Context Awareness (2 consolidated tools)
-    "context_get": context_tools.context_get,
-    "context_capture": context_tools.context_capture,
+    "context_get": _LazyTool("context_tools", "context_get"),
+    "context_capture": _LazyTool("context_tools", "context_capture"),
     
     # Media & Audio (2 consolidated tools)
-    "audio_control": audio_tools.audio_control,
-    "media_processor": audio_tools.media_processor,
+    "audio_control": _LazyTool("audio_tools", "audio_control"),
+    "media_processor": _LazyTool("audio_tools", "media_processor"),
     
     # Vision & Camera (1 consolidated tool)
-    "vision_system": vision_tools.vision_system,
+    "vision_system": _LazyTool("vision_tools", "vision_system"),
     
     # UI Interaction/Automation (2 consolidated tools)
-    "interact": automation_tools.interact,
-    "automation_sequence": automation_tools.automation_sequence,
+    "interact": _LazyTool("automation_tools", "interact"),
+    "automation_sequence": _LazyTool("automation_tools", "automation_sequence"),
     
     # Documents & Text (2 consolidated tools)
-    "document_processor": document_tools.document_processor,
-    "text_analyzer": document_tools.text_analyzer,
+    "document_processor": _LazyTool("document_tools", "document_processor"),
+    "text_analyzer": _LazyTool("document_tools", "text_analyzer"),
     
     # Development Tools (2 consolidated tools)
-    "dev_assistant": dev_tools.dev_assistant,
-    "code_manager": dev_tools.code_manager,
+    "dev_assistant": _LazyTool("dev_tools", "dev_assistant"),
+    "code_manager": _LazyTool("dev_tools", "code_manager"),
     
     # Data & Analytics (1 consolidated tool)
-    "data_processor": data_tools.data_processor,
+    "data_processor": _LazyTool("data_tools", "data_processor"),
     
     # Security & Privacy (1 consolidated tool)
-    "security_manager": security_tools.security_manager,
+    "security_manager": _LazyTool("security_tools", "security_manager"),
     
     # System Settings (1 consolidated tool)
-    "settings_manager": settings_tools.settings_manager,
+    "settings_manager": _LazyTool("settings_tools", "settings_manager"),
 }
 
 # Legacy Tool Registry - for backward compatibility
+# Read-only lookups whose answers rarely change are served from a short TTL cache
 LEGACY_TOOLS = {
     # Legacy system tools
-    "get_system_info": system_tools.get_system_info,
-    "get_battery_status": system_tools.get_battery_status,
-    "get_network_info": system_tools.get_network_info,
-    "list_processes": system_tools.list_processes,
-    "set_volume": system_tools.set_volume,
-    "get_volume": system_tools.get_volume,
-    "lock_screen": system_tools.lock_screen,
-    "shutdown_system": system_tools.shutdown_system,
+    "get_system_info": _ttl_cached(_LazyTool("system_tools", "get_system_info")),
+    "get_battery_status": _LazyTool("system_tools", "get_battery_status"),
+    "get_network_info": _LazyTool("system_tools", "get_network_info"),
+    "list_processes": _LazyTool("system_tools", "list_processes"),
+    "set_volume": _LazyTool("system_tools", "set_volume"),
+    "get_volume": _LazyTool("system_tools", "get_volume"),
+    "lock_screen": _LazyTool("system_tools", "lock_screen"),
+    "shutdown_system": _LazyTool("system_tools", "shutdown_system"),
     
     # Legacy context tools
-    "get_active_window_title": context_tools.get_active_window_title,
-    "get_cursor_position": context_tools.get_cursor_position,
-    "get_clipboard_text": context_tools.get_clipboard_text,
-    "set_clipboard_text": context_tools.set_clipboard_text,
-    "take_screenshot": context_tools.take_screenshot,
-    "detect_idle_state": context_tools.detect_idle_state,
-    "get_display_info": context_tools.get_display_info,
-    "screen_ocr": context_tools.screen_ocr,
+    "get_active_window_title": _LazyTool("context_tools", "get_active_window_title"),
+    "get_cursor_position": _LazyTool("context_tools", "get_cursor_position"),
+    "get_clipboard_text": _LazyTool("context_tools", "get_clipboard_text"),
+    "set_clipboard_text": _LazyTool("context_tools", "set_clipboard_text"),
+    "take_screenshot": _LazyTool("context_tools", "take_screenshot"),
+    "detect_idle_state": _LazyTool("context_tools", "detect_idle_state"),
+    "get_display_info": _ttl_cached(_LazyTool("context_tools", "get_display_info")),
+    "screen_ocr": _LazyTool("context_tools", "screen_ocr"),
     
     # Legacy automation tools
-    "click_at": automation_tools.click_at,
-    "type_text": automation_tools.type_text,
-    "scroll": automation_tools.scroll,
-    "hotkey_press": automation_tools.hotkey_press,
-    "drag_to": automation_tools.drag_to,
-    "move_mouse": automation_tools.move_mouse,
-    "key_press": automation_tools.key_press,
-    "double_click": automation_tools.double_click,
-    "right_click": automation_tools.right_click,
-    "run_macro": automation_tools.run_macro,
-    "record_macro": automation_tools.record_macro,
+    "click_at": _LazyTool("automation_tools", "click_at"),
+    "type_text": _LazyTool("automation_tools", "type_text"),
+    "scroll": _LazyTool("automation_tools", "scroll"),
+    "hotkey_press": _LazyTool("automation_tools", "hotkey_press"),
+    "drag_to": _LazyTool("automation_tools", "drag_to"),
+    "move_mouse": _LazyTool("automation_tools", "move_mouse"),
+    "key_press": _LazyTool("automation_tools", "key_press"),
+    "double_click": _LazyTool("automation_tools", "double_click"),
+    "right_click": _LazyTool("automation_tools", "right_click"),
+    "run_macro": _LazyTool("automation_tools", "run_macro"),
+    "record_macro": _LazyTool("automation_tools", "record_macro"),
     
     # Legacy file tools
-    "list_files": file_tools.list_files,
-    "read_file": file_tools.read_file,
-    "write_file": file_tools.write_file,
-    "delete_file": file_tools.delete_file,
-    "copy_file": file_tools.copy_file,
-    "move_file": file_tools.move_file,
-    "get_file_info": file_tools.get_file_info,
-    "search_files": file_tools.search_files,
+    "list_files": _LazyTool("file_tools", "list_files"),
+    "read_file": _LazyTool("file_tools", "read_file"),
+    "write_file": _LazyTool("file_tools", "write_file"),
+    "delete_file": _LazyTool("file_tools", "delete_file"),
+    "copy_file": _LazyTool("file_tools", "copy_file"),
+    "move_file": _LazyTool("file_tools", "move_file"),
+    "get_file_info": _LazyTool("file_tools", "get_file_info"),
+    "search_files": _LazyTool("file_tools", "search_files"),
     
     # Legacy app tools
-    "open_app": app_tools.open_app,
-    "close_app": app_tools.close_app,
-    "switch_app": app_tools.switch_app,
-    "list_apps": app_tools.list_apps,
-    "list_running_apps": app_tools.list_running_apps,
-    "get_active_window": app_tools.get_active_window,
+    "open_app": _LazyTool("app_tools", "open_app"),
+    "close_app": _LazyTool("app_tools", "close_app"),
+    "switch_app": _LazyTool("app_tools", "switch_app"),
+    "list_apps": _LazyTool("app_tools", "list_apps"),
+    "list_running_apps": _LazyTool("app_tools", "list_running_apps"),
+    "get_active_window": _LazyTool("app_tools", "get_active_window"),
     
     # Legacy shell tools
-    "run_command": shell_tools.run_command,
-    "install_package": shell_tools.install_package,
-    "get_env_vars": shell_tools.get_env_vars,
-    "set_env_var": shell_tools.set_env_var,
-    "kill_process_by_pid": shell_tools.kill_process_by_pid,
-    "start_shell_session": shell_tools.start_shell_session,
+    "run_command": _LazyTool("shell_tools", "run_command"),
+    "install_package": _LazyTool("shell_tools", "install_package"),
+    "get_env_vars": _LazyTool("shell_tools", "get_env_vars"),
+    "set_env_var": _LazyTool("shell_tools", "set_env_var"),
+    "kill_process_by_pid": _LazyTool("shell_tools", "kill_process_by_pid"),
+    "start_shell_session": _LazyTool("shell_tools", "start_shell_session"),
     
     # Legacy network tools
-    "ping_host": network_tools.ping_host,
-    "download_file": network_tools.download_file,
-    "http_request": network_tools.http_request,
-    "check_internet": network_tools.check_internet,
-    "get_public_ip": network_tools.get_public_ip,
-    "open_website": network_tools.open_website,
+    "ping_host": _LazyTool("network_tools", "ping_host"),
+    "download_file": _LazyTool("network_tools", "download_file"),
+    "http_request": _LazyTool("network_tools", "http_request"),
+    "check_internet": _LazyTool("network_tools", "check_internet"),
+    "get_public_ip": _ttl_cached(_LazyTool("network_tools", "get_public_ip")),
+    "open_website": _LazyTool("network_tools", "open_website"),
     
     # Legacy settings tools
-    "change_wallpaper": settings_tools.change_wallpaper,
-    "set_theme_mode": settings_tools.set_theme_mode,
-    "manage_bluetooth": settings_tools.manage_bluetooth,
-    "manage_wifi": settings_tools.manage_wifi,
-    "set_system_timezone": settings_tools.set_system_timezone,
-    "get_installed_fonts": settings_tools.get_installed_fonts,
+    "change_wallpaper": _LazyTool("settings_tools", "change_wallpaper"),
+    "set_theme_mode": _LazyTool("settings_tools", "set_theme_mode"),
+    "manage_bluetooth": _LazyTool("settings_tools", "manage_bluetooth"),
+    "manage_wifi": _LazyTool("settings_tools", "manage_wifi"),
+    "set_system_timezone": _LazyTool("settings_tools", "set_system_timezone"),
+    "get_installed_fonts": _ttl_cached(_LazyTool("settings_tools", "get_installed_fonts")),
     
     # Legacy dev tools
-    "create_virtual_env": dev_tools.create_virtual_env,
-    "run_python_script": dev_tools.run_python_script,
-    "get_git_status": dev_tools.get_git_status,
-    "commit_changes": dev_tools.commit_changes,
-    "run_tests": dev_tools.run_tests,
-    "build_project": dev_tools.build_project,
-    "lint_code": dev_tools.lint_code,
-    "format_code": dev_tools.format_code,
+    "create_virtual_env": _LazyTool("dev_tools", "create_virtual_env"),
+    "run_python_script": _LazyTool("dev_tools", "run_python_script"),
+    "get_git_status": _LazyTool("dev_tools", "get_git_status"),
+    "commit_changes": _LazyTool("dev_tools", "commit_changes"),
+    "run_tests": _LazyTool("dev_tools", "run_tests"),
+    "build_project": _LazyTool("dev_tools", "build_project"),
+    "lint_code": _LazyTool("dev_tools", "lint_code"),
+    "format_code": _LazyTool("dev_tools", "format_code"),
     
     # Legacy security tools
-    "encrypt_file": security_tools.encrypt_file,
-    "decrypt_file": security_tools.decrypt_file,
-    "generate_password": security_tools.generate_password,
-    "hash_text": security_tools.hash_text,
-    "clear_temp_files": security_tools.clear_temp_files,
+    "encrypt_file": _LazyTool("security_tools", "encrypt_file"),
+    "decrypt_file": _LazyTool("security_tools", "decrypt_file"),
+    "generate_password": _LazyTool("security_tools", "generate_password"),
+    "hash_text": _LazyTool("security_tools", "hash_text"),
+    "clear_temp_files": _LazyTool("security_tools", "clear_temp_files"),
     
     # Legacy audio tools
-    "record_audio": audio_tools.record_audio,
-    "play_audio": audio_tools.play_audio,
-    "speak_text": audio_tools.speak_text,
-    "transcribe_audio": audio_tools.transcribe_audio,
-    "list_audio_devices": audio_tools.list_audio_devices,
+    "record_audio": _LazyTool("audio_tools", "record_audio"),
+    "play_audio": _LazyTool("audio_tools", "play_audio"),
+    "speak_text": _LazyTool("audio_tools", "speak_text"),
+    "transcribe_audio": _LazyTool("audio_tools", "transcribe_audio"),
+    "list_audio_devices": _LazyTool("audio_tools", "list_audio_devices"),
     
     # Legacy vision tools
-    "capture_camera_image": vision_tools.capture_camera_image,
-    "start_camera_stream": vision_tools.start_camera_stream,
-    "stop_camera_stream": vision_tools.stop_camera_stream,
-    "detect_faces": vision_tools.detect_faces,
-    "detect_objects": vision_tools.detect_objects,
-    "analyze_scene": vision_tools.analyze_scene,
+    "capture_camera_image": _LazyTool("vision_tools", "capture_camera_image"),
+    "start_camera_stream": _LazyTool("vision_tools", "start_camera_stream"),
+    "stop_camera_stream": _LazyTool("vision_tools", "stop_camera_stream"),
+    "detect_faces": _LazyTool("vision_tools", "detect_faces"),
+    "detect_objects": _LazyTool("vision_tools", "detect_objects"),
+    "analyze_scene": _LazyTool("vision_tools", "analyze_scene"),
     
     # Legacy document tools
-    "summarize_text": document_tools.summarize_text,
-    "extract_text_from_pdf": document_tools.extract_text_from_pdf,
-    "convert_doc_format": document_tools.convert_doc_format,
-    "analyze_sentiment": document_tools.analyze_sentiment,
-    "spell_check": document_tools.spell_check,
-    "translate_text": document_tools.translate_text,
-    "search_text": document_tools.search_text,
+    "summarize_text": _LazyTool("document_tools", "summarize_text"),
+    "extract_text_from_pdf": _LazyTool("document_tools", "extract_text_from_pdf"),
+    "convert_doc_format": _LazyTool("document_tools", "convert_doc_format"),
+    "analyze_sentiment": _LazyTool("document_tools", "analyze_sentiment"),
+    "spell_check": _LazyTool("document_tools", "spell_check"),
+    "translate_text": _LazyTool("document_tools", "translate_text"),
+    "search_text": _LazyTool("document_tools", "search_text"),
     
     # Legacy data tools
-    "load_csv": data_tools.load_csv,
-    "describe_data": data_tools.describe_data,
-    "plot_chart": data_tools.plot_chart,
-    "query_data": data_tools.query_data,
-    "export_data": data_tools.export_data,
+    "load_csv": _LazyTool("data_tools", "load_csv"),
+    "describe_data": _LazyTool("data_tools", "describe_data"),
+    "plot_chart": _LazyTool("data_tools", "plot_chart"),
+    "query_data": _LazyTool("data_tools", "query_data"),
+    "export_data": _LazyTool("data_tools", "export_data"),
+}
+
+# Combined registry for all tools - a read-only view over both tables, no copy
+ALL_TOOLS = MappingProxyType(ChainMap(CONSOLIDATED_TOOLS, LEGACY_TOOLS))
+
+# Sync/async classification, computed once at import time (lazy entries wrap sync tools)
+_TOOL_IS_ASYNC = {name: asyncio.iscoroutinefunction(fn) for name, fn in ALL_TOOLS.items()}
+
+# Executor each sync tool is dispatched to
+_TOOL_POOL = {
+    name: TOOL_POOLS[_MODULE_POOLS.get(getattr(fn, "module", None), "io")]
+    for name, fn in ALL_TOOLS.items()
+}
+
+# Per-worker counters
+_stats = {
+    "tool_misses": 0
 }
 
-# Combined registry for all tools
-ALL_TOOLS = {**CONSOLIDATED_TOOLS, **LEGACY_TOOLS}
+def _build_dispatch_table(max_factor: int = 128):
+    """Pack the registry into parallel tuples indexed by a perfect hash
+    
+    Searches for the smallest table size for which hash(name) % size is
+    collision-free over all tool names. str hashes are cached on the object,
+    so a lookup costs one modulo, one tuple index and one string compare.
+    Returns None if no such size exists below len(ALL_TOOLS) * max_factor.
+    """
+    names = tuple(ALL_TOOLS)
+    for size in range(len(names), len(names) * max_factor):
+        if len({hash(name) % size for name in names}) == len(names):
+            break
+    else:
+        return None
+    
+    slot_names: List[Optional[str]] = [None] * size
+    slot_entries: List[Optional[Tuple[Callable, bool, Executor]]] = [None] * size
+    for name in names:
+        slot = hash(name) % size
+        slot_names[slot] = name
+        slot_entries[slot] = (ALL_TOOLS[name], _TOOL_IS_ASYNC[name], _TOOL_POOL[name])
+    return size, tuple(slot_names), tuple(slot_entries)
+
+_DISPATCH_TABLE = _build_dispatch_table()
+
+def _resolve(tool_name: str) -> Optional[Tuple[Callable, bool, Executor]]:
+    """Resolve a tool name to (function, is_async, executor), or None if unknown"""
+    if _DISPATCH_TABLE is not None:
+        size, slot_names, slot_entries = _DISPATCH_TABLE
+        slot = hash(tool_name) % size
+        return slot_entries[slot] if slot_names[slot] == tool_name else None
+    
+    # Plain mapping lookup if no perfect hash was found
+    tool_function = ALL_TOOLS.get(tool_name)
+    if tool_function is None:
+        return None
+    return tool_function, _TOOL_IS_ASYNC[tool_name], _TOOL_POOL[tool_name]
+
+def _miss_detail(tool_name: str) -> str:
+    # Kept O(1); the full tool list is only served by GET /tools
+    _stats["tool_misses"] += 1
+    return f"Tool {tool_name!r} not found; see GET /tools"
+
+def _dumps(payload: Any) -> bytes:
+    """Serialize a response payload for the wire"""
+    return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+# Constant pieces of an encoded tool response; only the values are encoded per call
+_TOOL_NAME_BYTES = {name: orjson.dumps(name) for name in ALL_TOOLS}
+_RESP_ID = b'{"id":'
+_RESP_SUCCESS = {True: b',"success":true', False: b',"success":false'}
+_RESP_RESULT = b',"result":'
+_RESP_ERROR = b',"error":'
+_RESP_TOOL_NAME = b',"tool_name":'
+_RESP_TIME = b',"execution_time_ms":'
+
+def _encode_tool_response(request_id: Any, response: Dict[str, Any]) -> bytes:
+    """Encode a WebSocket tool response by splicing values into the key skeleton"""
+    error = response["error"]
+    return b"".join((
+        _RESP_ID, b"null" if request_id is None else _dumps(request_id),
+        _RESP_SUCCESS[bool(response["success"])],
+        _RESP_RESULT, _dumps(response["result"]),
+        _RESP_ERROR, b"null" if error is None else _dumps(error),
+        _RESP_TOOL_NAME, _TOOL_NAME_BYTES[response["tool_name"]],
+        _RESP_TIME, repr(response["execution_time_ms"]).encode(),
+        b"}"
+    ))
+
+# Prebuilt reply for WebSocket frames that are not a JSON object with a tool_name
+_ERR_BAD_REQUEST = _dumps({
+    "id": None,
+    "success": False,
+    "error": "Invalid JSON format",
+    "tool_name": "unknown"
+})
+
+# The registry is fixed after import, so the listing payloads are encoded once
+_ROOT_BYTES = orjson.dumps({
+    "message": "QUE CORE API - Computer Use Agent Tool Server",
+    "version": "0.1.0",
+    "consolidated_tools": len(CONSOLIDATED_TOOLS),
+    "legacy_tools": len(LEGACY_TOOLS),
+    "total_tools": len(ALL_TOOLS)
+})
+
+_TOOLS_BYTES = orjson.dumps({
+    "consolidated_tools": list(CONSOLIDATED_TOOLS.keys()),
+    "legacy_tools": list(LEGACY_TOOLS.keys()),
+    "total_count": len(ALL_TOOLS),
+    "recommended": "Use consolidated tools for better performance and fewer API calls"
+})
+
+@lru_cache(maxsize=1)
+def _tools_metadata_bytes() -> bytes:
+    """Name, description and category of every tool, encoded once per worker
+    
+    Built on first request rather than at import: descriptions come from the
+    tool docstrings, and reading those loads the tool modules.
+    """
+    tools = []
+    for tool_name, tool_function in ALL_TOOLS.items():
+        try:
+            description = (tool_function.resolve() if isinstance(tool_function, _LazyTool) else tool_function).__doc__
+        except Exception:  # module whose optional dependencies are missing
+            description = None
+        tools.append({
+            "name": tool_name,
+            "description": description or "No description available",
+            "category": tool_name.split("_", 1)[0] if "_" in tool_name else "misc"
+        })
+    return orjson.dumps({"tools": tools, "total_count": len(tools)})
+
+_CONSOLIDATED_TOOLS_BYTES = orjson.dumps({
+    "tools": list(CONSOLIDATED_TOOLS.keys()),
+    "count": len(CONSOLIDATED_TOOLS),
+    "description": "These are the new consolidated tools that replace multiple legacy tools"
+})
 
 class ToolRequest(BaseModel):
+    model_config = ConfigDict(extra='ignore')
+    
     tool_name: str
     args: Optional[Dict[str, Any]] = None
 
 class ToolResponse(BaseModel):
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra='ignore')
+    
     success: bool
     result: Optional[Any] = None
     error: Optional[str] = None
     tool_name: str
     execution_time_ms: Optional[float] = None
 
+_inflight: Optional[asyncio.Semaphore] = None
+
+def _get_inflight() -> asyncio.Semaphore:
+    """Per-worker in-flight limit, created on first use so it binds to the serving loop
+    
+    Lazy rather than set in a startup hook, which ASGI hosts and test clients
+    that skip the lifespan protocol never run.
+    """
+    global _inflight
+    if _inflight is None:
+        _inflight = asyncio.Semaphore(MAX_INFLIGHT)
+    return _inflight
+
 @app.get("/")
 async def root():
-    return {
-        "message": "QUE CORE API - Computer Use Agent Tool Server",
-        "version": "0.1.0",
-        "consolidated_tools": len(CONSOLIDATED_TOOLS),
-        "legacy_tools": len(LEGACY_TOOLS),
-        "total_tools": len(ALL_TOOLS)
-    }
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 @app.get("/tools")
-async def list_tools():
-    """List all available tools"""
-    return {
-        "consolidated_tools": list(CONSOLIDATED_TOOLS.keys()),
-        "legacy_tools": list(LEGACY_TOOLS.keys()),
-        "total_count": len(ALL_TOOLS),
-        "recommended": "Use consolidated tools for better performance and fewer API calls"
-    }
+async def list_tools(detail: bool = False):
+    """List all available tools; with ?detail=1, each tool's description and category"""
+    if detail:
+        # First call imports the tool modules, so keep it off the event loop
+        return Response(content=await asyncio.to_thread(_tools_metadata_bytes), media_type="application/json")
+    return Response(content=_TOOLS_BYTES, media_type="application/json")
 
 @app.get("/tools/consolidated")
 async def list_consolidated_tools():
     """List only consolidated tools (recommended)"""
-    return {
-        "tools": list(CONSOLIDATED_TOOLS.keys()),
-        "count": len(CONSOLIDATED_TOOLS),
-        "description": "These are the new consolidated tools that replace multiple legacy tools"
-    }
+    return Response(content=_CONSOLIDATED_TOOLS_BYTES, media_type="application/json")
 
-@app.post("/call", response_model=ToolResponse)
-async def call_tool(request: ToolRequest):
-    """Call a tool with arguments"""
-    import time
-    start_time = time.time()
+@app.get("/stats")
+async def get_stats():
+    """Per-worker server counters"""
+    return _stats
+
+async def _execute_tool(tool_name: str, args: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Run a tool and build the response payload as a plain dict"""
+    start_time = perf_counter_ns()
     
-    if request.tool_name not in ALL_TOOLS:
-        raise HTTPException(
-            status_code=404, 
-            detail=f"Tool '{request.tool_name}' not found. Available tools: {list(ALL_TOOLS.keys())}"
-        )
+    entry = _resolve(tool_name)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=_miss_detail(tool_name))
     
+    # Shed load instead of letting calls pile up behind saturated executors
+    inflight = _get_inflight()
+    if inflight.locked():
+        raise HTTPException(status_code=503, detail="Server busy, too many tool calls in flight")
+    
+    tool_function, is_async, executor = entry
     try:
-        tool_function = ALL_TOOLS[request.tool_name]
-        result = tool_function(args=request.args or {})
+        # Blocking tools run in their executor so the event loop stays responsive
+        async with inflight:
+            if is_async:
+                result = await tool_function(args=args or {})
+            else:
+                result = await asyncio.get_running_loop().run_in_executor(
+                    executor, partial(tool_function, args=args or {})
+                )
         
-        execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+        execution_time = (perf_counter_ns() - start_time) / 1_000_000  # Convert to milliseconds
         
-        return ToolResponse(
-            success=result.get("success", False),
-            result=result.get("result"),
-            error=result.get("error"),
-            tool_name=request.tool_name,
-            execution_time_ms=round(execution_time, 2)
-        )
+        return {
+            "success": result.get("success", False),
+            "result": result.get("result"),
+            "error": result.get("error"),
+            "tool_name": tool_name,
+            "execution_time_ms": round(execution_time, 2)
+        }
     
     except Exception as e:
-        execution_time = (time.time() - start_time) * 1000
-        return ToolResponse(
-            success=False,
-            result=None,
-            error=f"Tool execution failed: {str(e)}",
-            tool_name=request.tool_name,
-            execution_time_ms=round(execution_time, 2)
-        )
+        execution_time = (perf_counter_ns() - start_time) / 1_000_000
+        return {
+            "success": False,
+            "result": None,
+            "error": f"Tool execution failed: {str(e)}",
+            "tool_name": tool_name,
+            "execution_time_ms": round(execution_time, 2)
+        }
+
+@app.post("/call", response_model=ToolResponse)
+async def call_tool(request: ToolRequest):
+    """Call a tool with arguments"""
+    response = ToolResponse(**await _execute_tool(request.tool_name, request.args))
+    # Serialize with pydantic-core directly instead of re-validating via response_model
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+async def _run_ws_request(data: Union[str, bytes]) -> bytes:
+    """Parse and execute one WebSocket frame, returning the encoded response"""
+    try:
+        request_data = orjson.loads(data)
+        tool_name = request_data["tool_name"]
+    except (orjson.JSONDecodeError, KeyError, TypeError):
+        return _ERR_BAD_REQUEST
+    
+    # Cheap structural checks instead of a full ToolRequest validation pass
+    request_id = request_data.get("id")
+    args = request_data.get("args")
+    if type(tool_name) is not str or (args is not None and type(args) is not dict):
+        return _dumps({
+            "id": request_id,
+            "success": False,
+            "error": "tool_name must be a string and args an object",
+            "tool_name": "unknown"
+        })
+    
+    try:
+        # Execute tool; the wire payload is built straight from the dict
+        response = await _execute_tool(tool_name, args)
+    except HTTPException as e:
+        return _dumps({"id": request_id, "success": False, "error": e.detail, "tool_name": tool_name})
+    return _encode_tool_response(request_id, response)
+
+async def _handle_ws_message(data: Union[str, bytes], send: Callable[[bytes], Awaitable[None]],
+                             in_flight: asyncio.Semaphore):
+    """Execute one multiplexed WebSocket tool call and send its response"""
+    try:
+        response = await _run_ws_request(data)
+    finally:
+        in_flight.release()
+    await send(response)
+
+async def _ws_batch_writer(send_frame: Callable[[bytes], Awaitable[None]], outbox: asyncio.Queue):
+    """Coalesce queued responses into JSON-array frames
+    
+    Waits up to WS_BATCH_WINDOW seconds after the first response for more to
+    arrive, then flushes at most WS_BATCH_MAX responses in a single frame.
+    A None in the outbox flushes what is queued before it and stops the writer.
+    """
+    loop = asyncio.get_running_loop()
+    closing = False
+    while not closing:
+        item = await outbox.get()
+        if item is None:
+            return
+        batch = [item]
+        deadline = loop.time() + WS_BATCH_WINDOW
+        while len(batch) < WS_BATCH_MAX:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(outbox.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                closing = True
+                break
+            batch.append(item)
+        await send_frame(b"[" + b",".join(batch) + b"]")
 
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
-    """WebSocket endpoint for real-time tool calling"""
+    """WebSocket endpoint for real-time tool calling
+    
+    Calls are dispatched concurrently; each response echoes the client-supplied
+    "id" so callers can match responses that complete out of order.
+    Connect with ?batch=1 to receive responses coalesced into JSON arrays.
+    Responses are text frames; connect with ?binary=1 to get the encoded
+    JSON as binary frames instead, skipping the decode to str.
+    """
     await websocket.accept()
     
+    in_flight = asyncio.Semaphore(WS_MAX_IN_FLIGHT)
+    tasks = set()
+    writer = None
+    disconnected = False
+    
+    if websocket.query_params.get("binary") == "1":
+        send_frame = websocket.send_bytes
+    else:
+        async def send_frame(payload: bytes):
+            await websocket.send_text(payload.decode())
+    
+    if websocket.query_params.get("batch") == "1":
+        outbox: asyncio.Queue = asyncio.Queue()
+        writer = asyncio.create_task(_ws_batch_writer(send_frame, outbox))
+        
+        async def send(payload: bytes):
+            outbox.put_nowait(payload)
+    else:
+        send_lock = asyncio.Lock()
+        
+        async def send(payload: bytes):
+            # Starlette websockets are not safe for concurrent sends
+            async with send_lock:
+                await send_frame(payload)
+    
     try:
         while True:
-            # Receive tool request
-            data = await websocket.receive_text()
-            request_data = json.loads(data)
-            
-            # Create tool request
-            request = ToolRequest(**request_data)
+            # Stop reading once the connection has too many calls in flight
+            await in_flight.acquire()
+            try:
+                message = await websocket.receive()
+            except BaseException:
+                in_flight.release()
+                raise
+            if message["type"] == "websocket.disconnect":
+                in_flight.release()
+                raise WebSocketDisconnect(message.get("code", 1000))
             
-            # Execute tool
-            response = await call_tool(request)
+            # Text and binary frames are both parsed from their raw payload
+            data = message.get("bytes") or message.get("text") or b""
             
-            # Send response
-            await websocket.send_text(response.json())
+            task = asyncio.create_task(_handle_ws_message(data, send, in_flight))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
     
     except WebSocketDisconnect:
+        disconnected = True
         print("WebSocket client disconnected")
     except Exception as e:
-        await websocket.send_text(json.dumps({
+        await send(_dumps({
             "success": False,
             "error": f"WebSocket error: {str(e)}"
         }))
+    finally:
+        for task in tasks:
+            task.cancel()
+        if writer:
+            if disconnected:
+                writer.cancel()
+            else:
+                # Let the writer flush what is queued, e.g. the error frame above
+                outbox.put_nowait(None)
+                await asyncio.wait({writer}, timeout=1.0)
+                writer.cancel()
+            # Reap the writer so a send failure inside it is reported, not lost
+            (writer_error,) = await asyncio.gather(writer, return_exceptions=True)
+            if writer_error is not None and not isinstance(writer_error, asyncio.CancelledError):
+                print(f"WebSocket batch writer failed: {writer_error!r}")
 
-def start_server(host: str = "0.0.0.0", port: int = 8000):
-    """Start the QUE CORE API server"""
+def start_server(host: str = "0.0.0.0", port: int = 8000, workers: Optional[int] = None):
+    """Start the QUE CORE API server
+    
+    Runs 2*CPU+1 worker processes on uvloop/httptools by default. Containerized
+    deployments can override with QUE_WORKERS, QUE_LOOP, QUE_HTTP, QUE_LOG_LEVEL
+    and QUE_KEEP_ALIVE.
+    """
+    workers = workers or int(os.getenv("QUE_WORKERS", "0")) or max(2, (os.cpu_count() or 1) * 2 + 1)
+    loop = os.getenv("QUE_LOOP", "asyncio" if sys.platform == "win32" else "uvloop")
+    http = os.getenv("QUE_HTTP", "httptools")
+    
     print(f"🚀 Starting QUE CORE API Server...")
     print(f"📡 Server URL: http://{host}:{port}")
     print(f"🔧 Consolidated Tools: {len(CONSOLIDATED_TOOLS)}")
     print(f"🔄 Legacy Tools: {len(LEGACY_TOOLS)}")
     print(f"📊 Total Tools: {len(ALL_TOOLS)}")
+    print(f"⚙️ Workers: {workers} ({loop}/{http})")
+    
+    # Multiple workers require the app as an import string
+    uvicorn.run(
+        "que_core.api.server:app",
+        host=host,
+        port=port,
+        workers=workers,
+        loop=loop,
+        http=http,
+        timeout_keep_alive=KEEP_ALIVE_TIMEOUT,
+        log_level=os.getenv("QUE_LOG_LEVEL", "warning")
+    )
+
+def start_server_h2(host: str = "0.0.0.0", port: int = 8000,
+                    certfile: Optional[str] = None, keyfile: Optional[str] = None):
+    """Start the QUE CORE API server on hypercorn with HTTP/2
+    
+    HTTP/2 lets one agent connection carry many concurrent /call requests.
+    With certfile/keyfile, h2 is negotiated via ALPN; without them clients must
+    use cleartext HTTP/2 (prior knowledge or h2c upgrade). Requires the
+    optional "http2" extra (hypercorn).
+    """
+    try:
+        from hypercorn.asyncio import serve
+        from hypercorn.config import Config
+    except ImportError:
+        raise ImportError("HTTP/2 support requires hypercorn: pip install que-core[http2]")
+    
+    config = Config()
+    config.bind = [f"{host}:{port}"]
+    config.alpn_protocols = ["h2", "http/1.1"]
+    config.keep_alive_timeout = KEEP_ALIVE_TIMEOUT
+    config.certfile = certfile
+    config.keyfile = keyfile
+    
+    print("🚀 Starting QUE CORE API Server (HTTP/2)...")
+    print(f"📡 Server URL: {'https' if certfile else 'http'}://{host}:{port}")
+    print(f"📊 Total Tools: {len(ALL_TOOLS)}")
     
-    uvicorn.run(app, host=host, port=port)
+    asyncio.run(serve(app, config))
+
+def main():
+    """Command line entrypoint for que-server"""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="QUE CORE API Server")
+    parser.add_argument("--host", default="0.0.0.0", help="Host to bind to")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind to")
+    parser.add_argument("--workers", type=int, default=None, help="Number of uvicorn worker processes")
+    parser.add_argument("--http2", action="store_true", help="Serve HTTP/2 via hypercorn instead of uvicorn")
+    parser.add_argument("--certfile", default=None, help="TLS certificate (HTTP/2 mode)")
+    parser.add_argument("--keyfile", default=None, help="TLS private key (HTTP/2 mode)")
+    
+    args = parser.parse_args()
+    
+    if args.http2:
+        start_server_h2(args.host, args.port, certfile=args.certfile, keyfile=args.keyfile)
+    else:
+        start_server(args.host, args.port, workers=args.workers)
 
 if __name__ == "__main__":
-    start_server()
+    main()
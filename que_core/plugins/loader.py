@@ -1,21 +1,43 @@
 """
 Plugin loader - dynamically discover and load third-party tool plugins.
-Plugins must expose a manifest (JSON/YAML) and a Python entrypoint.
+Plugins are pip packages exposing an entry point in the "que_core.plugins" group.
 TODO:
- - implement plugin discovery (folders, pip packages)
+ - implement plugin discovery from folders
  - validate plugin manifests against que_core.schemas.tools_registry
  - hot-reload support via file watchers
 """
-import importlib
+import importlib.metadata
 import logging
+from functools import lru_cache
 logger = logging.getLogger("que_core.plugins")
 
+PLUGIN_ENTRY_POINT_GROUP = "que_core.plugins"
+
 def discover_plugins(plugin_dirs=None):
-    # Placeholder
-    logger.info("Discovering plugins (TODO)")
-    return []
+    """Return the installed plugin entry points as a list
+    
+    The entry point scan is cached after the first call. plugin_dirs is
+    accepted for folder discovery, which is not implemented yet (see TODO).
+    """
+    if plugin_dirs:
+        logger.debug("Folder plugin discovery not implemented; ignoring %s", plugin_dirs)
+    return list(_entry_point_plugins())
+
+@lru_cache(maxsize=1)
+def _entry_point_plugins():
+    """Scan installed packages for plugin entry points (cached after the first scan)"""
+    logger.info("Discovering plugins")
+    entry_points = importlib.metadata.entry_points()
+    if hasattr(entry_points, "select"):
+        return tuple(entry_points.select(group=PLUGIN_ENTRY_POINT_GROUP))
+    # Python 3.9 returns a dict of group -> entry points
+    return tuple(entry_points.get(PLUGIN_ENTRY_POINT_GROUP, ()))
 
+@lru_cache(maxsize=None)
 def load_plugin(module_name):
-    # Placeholder
-    logger.info(f"Loading plugin {module_name} (TODO)")
+    """Load a discovered plugin by entry point name (cached per name)"""
+    logger.info("Loading plugin %s", module_name)
+    for entry_point in _entry_point_plugins():
+        if entry_point.name == module_name:
+            return entry_point.load()
     return None
@@ -3,11 +3,20 @@ Provides robust pub/sub implementation with asyncio + queues
 """
 import asyncio
 import logging
+import os
+import sys
+import threading
 import time
-from typing import Callable, Dict, List, Any, Optional, Union
-from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Set, Tuple, Union
 from enum import Enum
 
+# Try to import Rust engine, fallback to Python dispatch loop
+try:
+    from que_core_engine import rust_dispatch_sync
+    RUST_AVAILABLE = True
+except ImportError:
+    RUST_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 class EventPriority(Enum):
@@ -16,22 +25,175 @@ class EventPriority(Enum):
     HIGH = 3
     CRITICAL = 4
 
-@dataclass
 class Event:
-    name: str
-    payload: Any
-    timestamp: float
-    priority: EventPriority = EventPriority.NORMAL
-    source: Optional[str] = None
-    correlation_id: Optional[str] = None
+    """Bus event - a __slots__ class (no per-instance __dict__) since one is built per publish"""
+    __slots__ = ("name", "payload", "timestamp", "priority", "source", "correlation_id")
+    
+    def __init__(self, name: str, payload: Any, timestamp: int,
+                 priority: EventPriority = EventPriority.NORMAL,
+                 source: Optional[str] = None,
+                 correlation_id: Optional[str] = None):
+        self.name = name
+        self.payload = payload
+        self.timestamp = timestamp  # time.monotonic_ns(); for ordering/latency, not wall clock
+        self.priority = priority
+        self.source = source
+        self.correlation_id = correlation_id
+    
+    def __repr__(self) -> str:
+        return (f"Event(name={self.name!r}, payload={self.payload!r}, timestamp={self.timestamp!r}, "
+                f"priority={self.priority}, source={self.source!r}, correlation_id={self.correlation_id!r})")
+    
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not Event:
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in Event.__slots__)
+
+class SpscEventRing:
+    """Fixed-capacity FIFO ring buffer of events
+    
+    Storage follows CPython's _queuemodule.c RingBuf: a preallocated list with
+    put/get indices. Capacity is rounded up to a power of two so slots are
+    addressed with a mask. The single producer (publish) and single consumer
+    (_process_events) both run on the event loop thread, so no locking is needed.
+    """
+    
+    def __init__(self, maxsize: int):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        capacity = 1 << (maxsize - 1).bit_length()
+        self._items: List[Any] = [None] * capacity
+        self._mask = capacity - 1
+        self._put_idx = 0
+        self._get_idx = 0
+    
+    def __len__(self) -> int:
+        return self._put_idx - self._get_idx
+    
+    def push(self, item: Any) -> bool:
+        """Append an item; returns False (dropping it) if the ring is full"""
+        put_idx = self._put_idx
+        if put_idx - self._get_idx >= self.maxsize:
+            return False
+        self._items[put_idx & self._mask] = item
+        self._put_idx = put_idx + 1
+        return True
+    
+    def drain_into(self, batch: List[Any]):
+        """Move every queued item onto batch in FIFO order"""
+        items, mask = self._items, self._mask
+        get_idx, put_idx = self._get_idx, self._put_idx
+        while get_idx != put_idx:
+            slot = get_idx & mask
+            batch.append(items[slot])
+            items[slot] = None
+            get_idx += 1
+        self._get_idx = get_idx
+
+class PriorityEventQueue:
+    """Bounded event queue that hands out higher-priority events first
+    
+    Keeps one SpscEventRing per EventPriority level, so ordering is by priority
+    and FIFO within a level with O(1) push and pop. The consumer is only woken
+    on the empty -> non-empty transition.
+    """
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._size = 0
+        # Highest priority first, which is also the drain order
+        self._rings = {
+            priority: SpscEventRing(maxsize)
+            for priority in sorted(EventPriority, key=lambda p: p.value, reverse=True)
+        }
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def push(self, event: Event) -> bool:
+        """Queue an event; returns False (dropping it) if the queue is full"""
+        size = self._size
+        if size >= self.maxsize:
+            return False
+        ring = self._rings.get(event.priority)
+        if ring is None:
+            ring = self._rings[self._coerce_priority(event.priority)]
+        ring.push(event)
+        self._size = size + 1
+        if size == 0:
+            self._not_empty.set()
+        return True
+    
+    @staticmethod
+    def _coerce_priority(priority: Any) -> EventPriority:
+        """Map a raw priority value (e.g. 3) to its EventPriority, else NORMAL"""
+        try:
+            return EventPriority(priority)
+        except ValueError:
+            return EventPriority.NORMAL
+    
+    async def put(self, event: Event):
+        """Queue an event, waiting for the consumer to make room if full"""
+        while not self.push(event):
+            self._not_full.clear()
+            await self._not_full.wait()
+    
+    def drain(self) -> List[Event]:
+        """Remove and return every queued event, highest priority first"""
+        batch: List[Event] = []
+        for ring in self._rings.values():
+            ring.drain_into(batch)
+        self._size = 0
+        self._not_empty.clear()
+        self._not_full.set()
+        return batch
+    
+    async def wait(self):
+        """Wait until at least one event is queued (or wake() is called)"""
+        await self._not_empty.wait()
+    
+    def wake(self):
+        """Release a consumer blocked in wait() without queueing anything"""
+        self._not_empty.set()
 
 class EventBus:
-    """Enhanced event bus with async support and priority handling"""
+    """Enhanced event bus with async support and priority handling
     
-    def __init__(self, max_queue_size: int = 1000):
-        self._subscribers: Dict[str, List[Callable]] = {}
-        self._async_subscribers: Dict[str, List[Callable]] = {}
-        self._event_queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+    With recycle_events=True, Event objects are drawn from a preallocated
+    free list and returned to it once their async handlers have run, so
+    steady-state publishing allocates nothing. Only enable it when handlers
+    don't keep references to events past their own call.
+    """
+    
+    def __init__(self, max_queue_size: int = 1000, recycle_events: bool = False):
+        # Handler tables map event names to tuples that are replaced, never mutated,
+        # on (un)subscribe (copy-on-write): readers take a reference and iterate it
+        # without locking, while writers serialize on _write_lock
+        self._subscribers: Dict[str, Tuple[Callable, ...]] = {}
+        # Async subscribers are stored as (handler, is_coro, blocking)
+        self._async_subscribers: Dict[str, Tuple[Tuple[Callable, bool, bool], ...]] = {}
+        # Per-name dispatch functions generated from _async_subscribers (see
+        # _compile_dispatcher), so the processor doesn't re-inspect handler flags
+        self._compiled_dispatchers: Dict[str, Callable] = {}
+        # Bumped on every (un)subscribe; publisher threads keep a snapshot of the
+        # sync handler table and only rebuild it when the version moves
+        self._version = 0
+        # Names with at least one sync or async subscriber, swapped wholesale on
+        # (un)subscribe so publish can drop unheard events with one set lookup
+        self._known_events: FrozenSet[str] = frozenset()
+        self._write_lock = threading.Lock()
+        self._tls = threading.local()
+        self._event_queue = PriorityEventQueue(max_queue_size)
+        # Names of coalesced events currently sitting in the queue
+        self._pending_names: Set[str] = set()
+        self._pool_size = max_queue_size
+        self._pool: Optional[List[Event]] = (
+            [Event(None, None, 0) for _ in range(max_queue_size)] if recycle_events else None
+        )
         self._running = False
         self._processor_task: Optional[asyncio.Task] = None
         self._stats = {
@@ -40,73 +202,135 @@ class EventBus:
             "errors": 0
         }
     
-    def subscribe(self, event_name: str, handler: Callable, async_handler: bool = False):
-        """Subscribe to events"""
-        if async_handler:
-            self._async_subscribers.setdefault(event_name, []).append(handler)
-        else:
-            self._subscribers.setdefault(event_name, []).append(handler)
+    def subscribe(self, event_name: str, handler: Callable, async_handler: bool = False,
+                  blocking: bool = False):
+        """Subscribe to events
         
-        logger.debug(f"Subscribed to '{event_name}' (async={async_handler})")
+        Plain functions subscribed with async_handler=True run inline on the
+        event loop; pass blocking=True for ones that block, to run them in a thread.
+        """
+        # Interned keys let dict lookups on publish match by identity
+        event_name = sys.intern(event_name)
+        with self._write_lock:
+            if async_handler:
+                entry = (handler, asyncio.iscoroutinefunction(handler), blocking)
+                self._async_subscribers[event_name] = self._async_subscribers.get(event_name, ()) + (entry,)
+                self._compile_dispatcher(event_name)
+            else:
+                self._subscribers[event_name] = self._subscribers.get(event_name, ()) + (handler,)
+            self._subscribers_changed()
+        
+        logger.debug("Subscribed to '%s' (async=%s)", event_name, async_handler)
     
     def unsubscribe(self, event_name: str, handler: Callable):
         """Unsubscribe from events"""
-        # Remove from sync subscribers
-        if event_name in self._subscribers:
-            try:
-                self._subscribers[event_name].remove(handler)
-                if not self._subscribers[event_name]:
+        with self._write_lock:
+            # Remove from sync subscribers
+            handlers = self._subscribers.get(event_name)
+            if handlers is not None and handler in handlers:
+                i = handlers.index(handler)
+                handlers = handlers[:i] + handlers[i + 1:]
+                if handlers:
+                    self._subscribers[event_name] = handlers
+                else:
                     del self._subscribers[event_name]
-            except ValueError:
-                pass
+            
+            # Remove from async subscribers
+            handlers = self._async_subscribers.get(event_name)
+            if handlers is not None:
+                for i, entry in enumerate(handlers):
+                    if entry[0] == handler:
+                        handlers = handlers[:i] + handlers[i + 1:]
+                        if handlers:
+                            self._async_subscribers[event_name] = handlers
+                        else:
+                            del self._async_subscribers[event_name]
+                        self._compile_dispatcher(event_name)
+                        break
+            
+            self._subscribers_changed()
+    
+    def _subscribers_changed(self):
+        """Refresh derived subscriber state; call with _write_lock held"""
+        self._known_events = frozenset(self._subscribers).union(self._async_subscribers)
+        self._version += 1
+    
+    def _compile_dispatcher(self, event_name: str):
+        """Generate the async dispatch function for one event name
         
-        # Remove from async subscribers
-        if event_name in self._async_subscribers:
-            try:
-                self._async_subscribers[event_name].remove(handler)
-                if not self._async_subscribers[event_name]:
-                    del self._async_subscribers[event_name]
-            except ValueError:
-                pass
+        The handler tuple only changes on (un)subscribe, so the per-handler
+        branching is done here once: the generated function runs quick sync
+        handlers inline and appends (event, handler, is_coro) for the rest to
+        the caller's list, in subscription order. Call with _write_lock held.
+        """
+        handlers = self._async_subscribers.get(event_name)
+        if not handlers:
+            self._compiled_dispatchers.pop(event_name, None)
+            return
+        
+        namespace: Dict[str, Any] = {}
+        lines = ["def _dispatch(event, calls, on_error):"]
+        for i, (handler, is_coro, blocking) in enumerate(handlers):
+            namespace[f"h{i}"] = handler
+            if is_coro:
+                lines.append(f"    calls.append((event, h{i}, True))")
+            elif blocking:
+                lines.append(f"    calls.append((event, h{i}, False))")
+            else:
+                lines.append(f"    try:\n        h{i}(event)\n"
+                             f"    except Exception as e:\n        on_error(event, e)")
+        exec("\n".join(lines), namespace)
+        self._compiled_dispatchers[event_name] = namespace["_dispatch"]
     
     def publish(self, event_name: str, payload: Any = None, 
                 priority: EventPriority = EventPriority.NORMAL,
                 source: Optional[str] = None,
-                correlation_id: Optional[str] = None):
-        """Publish event (sync)"""
-        event = Event(
-            name=event_name,
-            payload=payload,
-            timestamp=time.time(),
-            priority=priority,
-            source=source,
-            correlation_id=correlation_id
-        )
+                correlation_id: Optional[str] = None,
+                drop_if_no_subscribers: bool = True,
+                coalesce: bool = False):
+        """Publish event (sync)
+        
+        Events nobody subscribes to are dropped before an Event is built; pass
+        drop_if_no_subscribers=False to queue them regardless. With
+        coalesce=True the event is dropped if one of the same name, also
+        published with coalesce=True, is still queued (e.g. heartbeats).
+        """
+        if drop_if_no_subscribers and event_name not in self._known_events:
+            return
+        event_name = sys.intern(event_name)
+        if coalesce:
+            if event_name in self._pending_names:
+                return
+            self._pending_names.add(event_name)
+        event = self._new_event(event_name, payload, priority, source, correlation_id)
         
         # Handle sync subscribers immediately
         self._handle_sync_subscribers(event)
         
         # Queue for async processing
-        try:
-            self._event_queue.put_nowait(event)
+        if self._event_queue.push(event):
             self._stats["events_published"] += 1
-        except asyncio.QueueFull:
-            logger.warning(f"Event queue full, dropping event: {event_name}")
+        else:
+            logger.warning("Event queue full, dropping event: %s", event_name)
             self._stats["errors"] += 1
+            if coalesce:
+                self._pending_names.discard(event_name)
     
     async def publish_async(self, event_name: str, payload: Any = None,
                            priority: EventPriority = EventPriority.NORMAL,
                            source: Optional[str] = None,
-                           correlation_id: Optional[str] = None):
+                           correlation_id: Optional[str] = None,
+                           drop_if_no_subscribers: bool = True,
+                           coalesce: bool = False):
         """Publish event (async)"""
-        event = Event(
-            name=event_name,
-            payload=payload,
-            timestamp=time.time(),
-            priority=priority,
-            source=source,
-            correlation_id=correlation_id
-        )
+        if drop_if_no_subscribers and event_name not in self._known_events:
+            return
+        event_name = sys.intern(event_name)
+        if coalesce:
+            if event_name in self._pending_names:
+                return
+            self._pending_names.add(event_name)
+        event = self._new_event(event_name, payload, priority, source, correlation_id)
         
         # Handle sync subscribers immediately
         self._handle_sync_subscribers(event)
@@ -115,41 +339,129 @@ class EventBus:
         await self._event_queue.put(event)
         self._stats["events_published"] += 1
     
+    def _new_event(self, event_name: str, payload: Any, priority: EventPriority,
+                   source: Optional[str], correlation_id: Optional[str]) -> Event:
+        """Take an Event from the free list if recycling, else allocate one"""
+        pool = self._pool
+        if pool:
+            try:
+                event = pool.pop()
+            except IndexError:  # emptied by a publisher on another thread
+                pass
+            else:
+                event.name = event_name
+                event.payload = payload
+                event.timestamp = time.monotonic_ns()
+                event.priority = priority
+                event.source = source
+                event.correlation_id = correlation_id
+                return event
+        return Event(
+            name=event_name,
+            payload=payload,
+            timestamp=time.monotonic_ns(),
+            priority=priority,
+            source=source,
+            correlation_id=correlation_id
+        )
+    
+    def _recycle_events(self, events: List[Event]):
+        """Return dispatched events to the free list, up to its original size"""
+        pool = self._pool
+        for event in events[:self._pool_size - len(pool)]:
+            # Drop references so a pooled event doesn't keep its payload alive
+            event.payload = event.source = event.correlation_id = None
+            pool.append(event)
+    
     def _handle_sync_subscribers(self, event: Event):
         """Handle synchronous subscribers"""
-        handlers = self._subscribers.get(event.name, [])
-        for handler in handlers:
+        cache = getattr(self._tls, "cache", None)
+        if cache is None or cache[0] != self._version:
+            cache = (self._version, dict(self._subscribers))
+            self._tls.cache = cache
+        
+        handlers = cache[1].get(event.name)
+        if handlers is None:
+            return
+        
+        # Rust engine runs the handler loop natively and reports failures by index
+        if RUST_AVAILABLE:
+            errors = rust_dispatch_sync(handlers, event)
+        else:
+            # One try block around the whole loop: on failure, record the index
+            # and resume with the next handler instead of re-entering a try per call
+            errors = None
+            i, n = 0, len(handlers)
+            while i < n:
+                try:
+                    while i < n:
+                        handlers[i](event)
+                        i += 1
+                except Exception as e:
+                    if errors is None:
+                        errors = []
+                    errors.append((i, e))
+                    i += 1
+        
+        if errors:
+            for _, e in errors:
+                logger.error("Error in sync handler for '%s': %s", event.name, e)
+            self._stats["errors"] += len(errors)
+    
+    def _on_async_handler_error(self, event: Event, error: Exception):
+        """Log and count an async handler failure"""
+        logger.error("Error in async handler for '%s': %s", event.name, error)
+        self._stats["errors"] += 1
+    
+    async def _handle_async_subscribers(self, events: List[Event]):
+        """Handle asynchronous subscribers for a batch of events"""
+        calls = []
+        dispatchers = self._compiled_dispatchers
+        on_error = self._on_async_handler_error
+        for event in events:
+            # Quick sync handlers run inline inside the dispatcher (a thread hop
+            # would cost more); coroutines and blocking handlers land in calls
+            dispatch = dispatchers.get(event.name)
+            if dispatch is not None:
+                dispatch(event, calls, on_error)
+        
+        if not calls:
+            return
+        
+        # A lone handler (the common case) is awaited directly - no Task needed
+        if len(calls) == 1:
+            event, handler, is_coro = calls[0]
+            try:
+                await (handler(event) if is_coro else asyncio.to_thread(handler, event))
+            except Exception as e:
+                on_error(event, e)
+            return
+        
+        # Otherwise schedule them all concurrently; remember each task's event
+        pending: Dict[asyncio.Future, Event] = {}
+        for event, handler, is_coro in calls:
             try:
-                handler(event)
+                if is_coro:
+                    pending[asyncio.ensure_future(handler(event))] = event
+                else:
+                    # Run blocking sync function in a thread
+                    pending[asyncio.ensure_future(asyncio.to_thread(handler, event))] = event
             except Exception as e:
-                logger.error(f"Error in sync handler for '{event.name}': {e}")
+                logger.error("Error creating task for '%s': %s", event.name, e)
                 self._stats["errors"] += 1
-    
-    async def _handle_async_subscribers(self, event: Event):
-        """Handle asynchronous subscribers"""
-        handlers = self._async_subscribers.get(event.name, [])
         
-        # Run all async handlers concurrently
-        if handlers:
-            tasks = []
-            for handler in handlers:
-                try:
-                    if asyncio.iscoroutinefunction(handler):
-                        tasks.append(asyncio.create_task(handler(event)))
-                    else:
-                        # Wrap sync function in async
-                        tasks.append(asyncio.create_task(asyncio.to_thread(handler, event)))
-                except Exception as e:
-                    logger.error(f"Error creating task for '{event.name}': {e}")
-                    self._stats["errors"] += 1
-            
-            if tasks:
-                # Wait for all handlers to complete
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                for i, result in enumerate(results):
-                    if isinstance(result, Exception):
-                        logger.error(f"Error in async handler for '{event.name}': {result}")
-                        self._stats["errors"] += 1
+        # Settle each handler as soon as it finishes rather than after the slowest
+        # one (as gather would); as_completed can't tell which event a result
+        # belongs to, so asyncio.wait is used on the tasks themselves
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                event = pending.pop(task)
+                if task.cancelled():
+                    continue
+                error = task.exception()
+                if isinstance(error, Exception):
+                    on_error(event, error)
     
     async def start(self):
         """Start the event bus processor"""
@@ -168,11 +480,16 @@ class EventBus:
         self._running = False
         
         if self._processor_task:
-            self._processor_task.cancel()
-            try:
-                await self._processor_task
-            except asyncio.CancelledError:
-                pass
+            # Wake the processor so it sees _running is False and exits after its
+            # current batch; cancel only if handlers keep it busy for too long
+            self._event_queue.wake()
+            done, _ = await asyncio.wait({self._processor_task}, timeout=1.0)
+            if not done:
+                self._processor_task.cancel()
+                try:
+                    await self._processor_task
+                except asyncio.CancelledError:
+                    pass
         
         logger.info("EventBus stopped")
     
@@ -182,26 +499,32 @@ class EventBus:
         
         while self._running:
             try:
-                # Get event with timeout to allow graceful shutdown
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
+                # No per-iteration timer: stop() wakes this wait directly
+                await self._event_queue.wait()
+                if not self._running:
+                    break
                 
-                # Process async subscribers
-                await self._handle_async_subscribers(event)
+                # Drain everything queued so far and dispatch it as one batch
+                events = self._event_queue.drain()
+                if self._pending_names:
+                    # Drained events are no longer pending; the next coalesced
+                    # publish of the same name is queued again
+                    self._pending_names.difference_update(event.name for event in events)
+                await self._handle_async_subscribers(events)
                 
-                self._stats["events_processed"] += 1
+                self._stats["events_processed"] += len(events)
+                if self._pool is not None:
+                    self._recycle_events(events)
                 
-            except asyncio.TimeoutError:
-                # Normal timeout, continue loop
-                continue
             except Exception as e:
-                logger.error(f"Error processing event: {e}")
+                logger.error("Error processing event: %s", e)
                 self._stats["errors"] += 1
     
     def get_stats(self) -> Dict[str, Any]:
         """Get event bus statistics"""
         return {
             **self._stats,
-            "queue_size": self._event_queue.qsize(),
+            "queue_size": len(self._event_queue),
             "subscriber_count": sum(len(handlers) for handlers in self._subscribers.values()),
             "async_subscriber_count": sum(len(handlers) for handlers in self._async_subscribers.values()),
             "running": self._running
@@ -209,12 +532,90 @@ class EventBus:
     
     def clear_subscribers(self):
         """Clear all subscribers"""
-        self._subscribers.clear()
-        self._async_subscribers.clear()
+        with self._write_lock:
+            self._subscribers.clear()
+            self._async_subscribers.clear()
+            self._compiled_dispatchers = {}
+            self._subscribers_changed()
         logger.info("All subscribers cleared")
 
+class ShardedEventBus:
+    """EventBus front-end that hash-partitions event names across shards
+    
+    Each shard has its own queue and processor task, so a slow handler only
+    holds up events that hash to the same shard. Sync subscribers still run
+    inline in the publisher, as with a single EventBus.
+    """
+    
+    def __init__(self, n_shards: Optional[int] = None, max_queue_size: int = 1000,
+                 recycle_events: bool = False):
+        n_shards = n_shards or os.cpu_count() or 1
+        self._shards = tuple(
+            EventBus(max_queue_size=max_queue_size, recycle_events=recycle_events)
+            for _ in range(n_shards)
+        )
+    
+    def _shard(self, event_name: str) -> EventBus:
+        return self._shards[hash(event_name) % len(self._shards)]
+    
+    def subscribe(self, event_name: str, handler: Callable, async_handler: bool = False,
+                  blocking: bool = False):
+        """Subscribe to events"""
+        self._shard(event_name).subscribe(event_name, handler, async_handler, blocking)
+    
+    def unsubscribe(self, event_name: str, handler: Callable):
+        """Unsubscribe from events"""
+        self._shard(event_name).unsubscribe(event_name, handler)
+    
+    def publish(self, event_name: str, payload: Any = None,
+                priority: EventPriority = EventPriority.NORMAL,
+                source: Optional[str] = None,
+                correlation_id: Optional[str] = None,
+                drop_if_no_subscribers: bool = True,
+                coalesce: bool = False):
+        """Publish event (sync)"""
+        self._shard(event_name).publish(event_name, payload, priority, source, correlation_id,
+                                        drop_if_no_subscribers=drop_if_no_subscribers,
+                                        coalesce=coalesce)
+    
+    async def publish_async(self, event_name: str, payload: Any = None,
+                            priority: EventPriority = EventPriority.NORMAL,
+                            source: Optional[str] = None,
+                            correlation_id: Optional[str] = None,
+                            drop_if_no_subscribers: bool = True,
+                            coalesce: bool = False):
+        """Publish event (async)"""
+        await self._shard(event_name).publish_async(event_name, payload, priority, source, correlation_id,
+                                                    drop_if_no_subscribers=drop_if_no_subscribers,
+                                                    coalesce=coalesce)
+    
+    async def start(self):
+        """Start every shard's event processor"""
+        await asyncio.gather(*(shard.start() for shard in self._shards))
+    
+    async def stop(self):
+        """Stop every shard's event processor"""
+        await asyncio.gather(*(shard.stop() for shard in self._shards))
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get event bus statistics summed over all shards"""
+        shard_stats = [shard.get_stats() for shard in self._shards]
+        stats = {
+            key: sum(s[key] for s in shard_stats)
+            for key in ("events_published", "events_processed", "errors", "queue_size",
+                        "subscriber_count", "async_subscriber_count")
+        }
+        stats["running"] = any(s["running"] for s in shard_stats)
+        stats["shards"] = len(self._shards)
+        return stats
+    
+    def clear_subscribers(self):
+        """Clear all subscribers"""
+        for shard in self._shards:
+            shard.clear_subscribers()
+
 # Global event bus instance
-_global_eventbus = EventBus()
+_global_eventbus = ShardedEventBus()
 
 # Legacy compatibility functions
 def subscribe(event_name: str, handler: Callable):
@@ -234,6 +635,6 @@ async def stop_eventbus():
     """Stop the global event bus"""
     await _global_eventbus.stop()
 
-def get_eventbus() -> EventBus:
+def get_eventbus() -> ShardedEventBus:
     """Get the global event bus instance"""
     return _global_eventbus
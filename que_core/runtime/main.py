@@ -159,7 +159,7 @@ class QUECoreRuntime:
                     self.eventbus.publish("que_core.context.heartbeat", {
                         "timestamp": asyncio.get_event_loop().time(),
                         "runtime_status": "running"
-                    })
+                    }, coalesce=True)
                 
                 # Wait 30 seconds before next update
                 await asyncio.sleep(30)
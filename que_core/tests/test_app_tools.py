@@ -0,0 +1,69 @@
+import os
+import subprocess
+
+import pytest
+
+from que_core.tools import app_tools
+
+
+def _stat_line(comm: bytes) -> bytes:
+    # pid (comm) state ppid pgrp session tty tpgid flags minflt cminflt majflt cmajflt
+    # utime stime cutime cstime priority nice threads itrealvalue starttime vsize rss ...
+    return (b"1234 (" + comm + b") S 1 1234 1234 0 -1 4194560 10 0 0 0 "
+            b"70 30 0 0 20 0 1 0 555 123456 42 18446744073709551615 0 0\n")
+
+
+@pytest.mark.parametrize("comm", [
+    b"bash", b"Web Content", b"(sd-pam)", b"a) S 1 2 (b", b"tricky ) name",
+])
+def test_parse_stat_bytes_handles_spaces_and_parentheses(comm):
+    assert app_tools._parse_stat_bytes(_stat_line(comm)) == (comm, 100, 42)
+
+
+def test_parse_stat_bytes_rejects_truncated_lines():
+    assert app_tools._parse_stat_bytes(b"1234 (bash) S 1 1234") is None
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs procfs")
+def test_linux_full_name_keeps_short_comm_and_falls_back_when_unreadable():
+    assert app_tools._linux_full_name("self", b"python") == "python"
+    assert app_tools._linux_full_name("0", b"x" * app_tools._COMM_LEN) == "x" * app_tools._COMM_LEN
+
+
+def test_launch_commands_pick_up_apps_installed_later(tmp_path, monkeypatch):
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ.get('PATH', '')}")
+    name = "que-test-late-app"
+    executable = tmp_path / name
+    assert (str(executable),) not in app_tools._linux_launch_commands(name)
+
+    executable.write_text("#!/bin/sh\n")
+    executable.chmod(0o755)
+    assert app_tools._linux_launch_commands(name)[0] == (str(executable),)
+
+
+@pytest.mark.parametrize("stdout, expected", [
+    ("Inbox - Mail\n62914567\n", ("Inbox - Mail", "62914567")),
+    ("notes.txt\n(modified)\n62914567\n", ("notes.txt\n(modified)", "62914567")),
+    ("\n62914567\n", ("", "62914567")),
+    ("62914567\nInbox - Mail\n", None),  # unexpected order
+    ("Inbox - Mail\n", None),
+    ("", None),
+])
+def test_get_active_window_parses_chained_xdotool_output(monkeypatch, stdout, expected):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout)
+
+    monkeypatch.setattr(app_tools, "_SYSTEM", "Linux")
+    monkeypatch.setattr(app_tools, "_XDOTOOL", "/usr/bin/xdotool")
+    monkeypatch.setattr(app_tools.subprocess, "run", fake_run)
+    result = app_tools._get_active_window_impl({})
+
+    assert calls == [["/usr/bin/xdotool", "getactivewindow", "getwindowname", "getactivewindow"]]
+    if expected is None:
+        assert result["success"] is False
+    else:
+        assert result["success"] is True
+        assert (result["result"]["title"], result["result"]["window_id"]) == expected
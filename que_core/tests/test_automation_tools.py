@@ -0,0 +1,96 @@
+import os
+import uuid
+from types import SimpleNamespace
+
+import pytest
+
+from que_core.tools import automation_tools
+
+
+def _char(c):
+    return SimpleNamespace(char=c)
+
+
+def _key(name):
+    return SimpleNamespace(char=None, name=name)
+
+
+@pytest.mark.parametrize("key, expected", [
+    (_char("a"), "a"),
+    (_char("\x03"), "c"),  # ctrl+c reported as a control character
+    (_key("ctrl_l"), "ctrl"),
+    (_key("shift_r"), "shift"),
+    (_key("page_down"), "pagedown"),
+    (_key("alt_gr"), "altgr"),
+    (object(), None),
+])
+def test_pynput_key_name(key, expected):
+    name = automation_tools._pynput_key_name(key)
+    assert name == (str(key) if expected is None else expected)
+
+
+@pytest.mark.parametrize("system, expected", [("Darwin", "command"), ("Linux", "win")])
+def test_pynput_cmd_key_name_follows_platform(monkeypatch, system, expected):
+    monkeypatch.setattr(automation_tools, "_SYSTEM", system)
+    assert automation_tools._pynput_key_name(_key("cmd_l")) == expected
+
+
+def test_recorded_event_step_for_clicks_and_scrolls():
+    assert automation_tools._recorded_event_step((1.23456, "click", 10, 20, "left")) == {
+        "action": "click", "x": 10, "y": 20, "button": "left", "at": 1.2346
+    }
+    assert automation_tools._recorded_event_step((2.0, "scroll", 5, 6, -3)) == {
+        "action": "scroll", "direction": "down", "amount": 3, "x": 5, "y": 6, "at": 2.0
+    }
+
+
+def test_recorded_steps_fold_chords_into_hotkeys():
+    ctrl, shift = _key("ctrl_l"), _key("shift")
+    events = [
+        (0.1, "key", ctrl), (0.15, "key", ctrl),  # auto-repeat
+        (0.2, "key", shift), (0.3, "key", _char("T")),
+        (0.4, "release", shift), (0.5, "release", ctrl),
+        (0.6, "key", _char("x")),
+        (0.7, "key", shift), (0.8, "release", shift),  # lone tap
+        (0.9, "release", ctrl),  # press fell out of the deque
+        (1.0, "click", 1, 2, "left"),
+        (1.1, "key", ctrl),  # still held when recording stopped
+    ]
+    assert automation_tools._recorded_steps(events) == [
+        {"action": "hotkey", "keys": ["ctrl", "shift", "T"], "at": 0.3},
+        {"action": "key", "key": "x", "at": 0.6},
+        {"action": "key", "key": "shift", "at": 0.7},
+        {"action": "click", "x": 1, "y": 2, "button": "left", "at": 1.0},
+        {"action": "key", "key": "ctrl", "at": 1.1},
+    ]
+
+
+def test_read_macro_rereads_a_rewritten_file(tmp_path):
+    macro_file = str(tmp_path / "m.json")
+    with open(macro_file, "wb") as f:
+        f.write(b'{"steps": [1]}')
+    stat = os.stat(macro_file)
+    assert automation_tools._read_macro(macro_file, stat.st_mtime_ns, stat.st_size) == {"steps": [1]}
+
+    # Same mtime (coarse timestamp granularity), different size
+    with open(macro_file, "wb") as f:
+        f.write(b'{"steps": [1, 2]}')
+    os.utime(macro_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    stat = os.stat(macro_file)
+    assert automation_tools._read_macro(macro_file, stat.st_mtime_ns, stat.st_size) == {"steps": [1, 2]}
+
+
+def test_replayed_macro_steps_are_not_mutated(monkeypatch):
+    name = f"test_{uuid.uuid4().hex}"
+    step = {"action": "double_click", "x": 1, "y": 2}
+    saved = automation_tools._save_macro_impl({"macro_name": name, "steps": [step, {"action": "right_click"}]})
+    try:
+        monkeypatch.setattr(automation_tools, "_click_impl", lambda args: {"success": True, "result": args, "error": None})
+        steps = automation_tools._load_macro_impl({"macro_name": name})["result"]["steps"]
+        assert automation_tools._double_click_impl(steps[0])["result"]["clicks"] == 2
+        assert automation_tools._right_click_impl(steps[1])["result"]["button"] == "right"
+        assert automation_tools._load_macro_impl({"macro_name": name})["result"]["steps"] == [
+            step, {"action": "right_click"}
+        ]
+    finally:
+        os.remove(saved["result"]["file_path"])
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from que_core.runtime.eventbus import Event, EventBus, EventPriority, PriorityEventQueue, SpscEventRing
+
+
+def test_ring_rejects_pushes_when_full():
+    ring = SpscEventRing(3)
+    assert [ring.push(i) for i in range(4)] == [True, True, True, False]
+    assert len(ring) == 3
+
+
+def test_ring_keeps_fifo_order_across_wraparound():
+    ring = SpscEventRing(3)  # rounded up to 4 slots
+    drained = []
+    for start in range(0, 30, 3):
+        for i in range(start, start + 3):
+            assert ring.push(i)
+        ring.drain_into(drained)
+        assert len(ring) == 0
+    assert drained == list(range(30))
+
+
+def test_ring_requires_positive_size():
+    with pytest.raises(ValueError):
+        SpscEventRing(0)
+
+
+def test_priority_queue_drains_highest_priority_first_fifo_within_level():
+    async def run():
+        queue = PriorityEventQueue(8)
+        for name, priority in [("low", EventPriority.LOW), ("normal-1", EventPriority.NORMAL),
+                               ("critical", EventPriority.CRITICAL), ("high", EventPriority.HIGH),
+                               ("normal-2", EventPriority.NORMAL)]:
+            assert queue.push(Event(name, None, 0, priority=priority))
+        return [event.name for event in queue.drain()], len(queue)
+
+    names, remaining = asyncio.run(run())
+    assert names == ["critical", "high", "normal-1", "normal-2", "low"]
+    assert remaining == 0
+
+
+def test_priority_queue_bounds_total_size_and_accepts_raw_priorities():
+    async def run():
+        queue = PriorityEventQueue(2)
+        accepted = [queue.push(Event("a", None, 0, priority=4)),
+                    queue.push(Event("b", None, 0, priority="unknown")),
+                    queue.push(Event("c", None, 0))]
+        return accepted, [event.name for event in queue.drain()]
+
+    accepted, names = asyncio.run(run())
+    assert accepted == [True, True, False]
+    assert names == ["a", "b"]
+
+
+def test_coalesced_events_are_queued_once_until_processed():
+    async def run():
+        bus = EventBus()
+        received = []
+
+        async def handler(event):
+            received.append(event.payload)
+
+        bus.subscribe("tick", handler, async_handler=True)
+        await bus.start()
+        for payload in (1, 2, 3):
+            bus.publish("tick", payload, coalesce=True)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        bus.publish("tick", 4, coalesce=True)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        await bus.stop()
+        return received
+
+    assert asyncio.run(run()) == [1, 4]
+
+
+def test_recycled_events_return_to_the_free_list():
+    async def run():
+        bus = EventBus(max_queue_size=4, recycle_events=True)
+        seen = []
+
+        async def handler(event):
+            seen.append((id(event), event.payload))
+
+        bus.subscribe("job", handler, async_handler=True)
+        await bus.start()
+        for payload in ("first", "second"):
+            bus.publish("job", payload)
+            for _ in range(5):
+                await asyncio.sleep(0)
+        await bus.stop()
+        return seen, bus._pool
+
+    seen, pool = asyncio.run(run())
+    assert [payload for _, payload in seen] == ["first", "second"]
+    assert seen[0][0] == seen[1][0]  # the same Event object served both publishes
+    assert len(pool) == 4
+    assert all(event.payload is None for event in pool)
+
+
+def test_rust_dispatch_sync_reports_failing_handlers_by_index():
+    engine = pytest.importorskip("que_core_engine")
+    calls = []
+
+    def ok(event):
+        calls.append(event)
+
+    def fail(event):
+        raise RuntimeError("boom")
+
+    errors = engine.rust_dispatch_sync((ok, fail, ok), "event")
+    assert calls == ["event", "event"]
+    assert [(index, type(error)) for index, error in errors] == [(1, RuntimeError)]
@@ -0,0 +1,148 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("fastapi")
+orjson = pytest.importorskip("orjson")
+
+from que_core.api import server
+
+
+def test_resolve_finds_every_registered_tool():
+    for name, tool_function in server.ALL_TOOLS.items():
+        resolved = server._resolve(name)
+        assert resolved is not None and resolved[0] is tool_function
+
+
+@pytest.mark.parametrize("name", ["", "nope", "app_manage", "app_manager ", "APP_MANAGER"])
+def test_resolve_rejects_unknown_names(name):
+    assert server._resolve(name) is None
+
+
+def test_resolve_rejects_names_sharing_a_slot():
+    if server._DISPATCH_TABLE is None:
+        pytest.skip("no perfect hash for this registry")
+    size, slot_names, _ = server._DISPATCH_TABLE
+    taken = {hash(name) % size for name in server.ALL_TOOLS}
+    colliding = next(f"unknown_{i}" for i in range(100000) if hash(f"unknown_{i}") % size in taken)
+    assert server._resolve(colliding) is None
+
+
+@pytest.mark.parametrize("request_id", [None, 7, "abc", {"nested": [1, 2]}])
+@pytest.mark.parametrize("response", [
+    {"success": True, "result": {"apps": [], "count": 0}, "error": None, "execution_time_ms": 1.25},
+    {"success": False, "result": None, "error": "Tool failed: \"quoted\"", "execution_time_ms": 0.0},
+    {"success": 1, "result": [1, "two", None], "error": None, "execution_time_ms": 12.0},
+])
+def test_encode_tool_response_matches_orjson(request_id, response):
+    response = {**response, "tool_name": "app_manager"}
+    expected = orjson.dumps({
+        "id": request_id,
+        "success": bool(response["success"]),
+        "result": response["result"],
+        "error": response["error"],
+        "tool_name": response["tool_name"],
+        "execution_time_ms": response["execution_time_ms"],
+    })
+    assert server._encode_tool_response(request_id, response) == expected
+
+
+class _FakeWebSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def send_bytes(self, data):
+        self.frames.append(data)
+
+
+def test_batch_writer_coalesces_queued_responses_into_array_frames(monkeypatch):
+    monkeypatch.setattr(server, "WS_BATCH_MAX", 3)
+
+    async def run():
+        websocket = _FakeWebSocket()
+        outbox = asyncio.Queue()
+        for i in range(4):
+            outbox.put_nowait(orjson.dumps({"id": i}))
+        writer = asyncio.create_task(server._ws_batch_writer(websocket.send_bytes, outbox))
+        await asyncio.sleep(server.WS_BATCH_WINDOW * 20)
+        writer.cancel()
+        await asyncio.gather(writer, return_exceptions=True)
+        return websocket.frames
+
+    frames = asyncio.run(run())
+    assert [[item["id"] for item in orjson.loads(frame)] for frame in frames] == [[0, 1, 2], [3]]
+
+
+def test_batch_writer_flushes_queued_responses_before_stopping():
+    async def run():
+        websocket = _FakeWebSocket()
+        outbox = asyncio.Queue()
+        for payload in (b'{"id":1}', b'{"error":"WebSocket error: boom"}', None, b'{"id":2}'):
+            outbox.put_nowait(payload)
+        await asyncio.wait_for(server._ws_batch_writer(websocket.send_bytes, outbox), timeout=1.0)
+        return websocket.frames
+
+    assert asyncio.run(run()) == [b'[{"id":1},{"error":"WebSocket error: boom"}]']
+
+
+def test_ttl_cache_is_bounded_and_expires():
+    calls = []
+
+    def tool(*, args):
+        calls.append(args["n"])
+        return {"success": True, "result": args["n"], "error": None}
+
+    cached = server._ttl_cached(tool, ttl=60.0, maxsize=2)
+    for n in (1, 2, 1, 3, 1, 2):
+        cached(args={"n": n})
+    # 1 stays cached as the most recently used; 2 is evicted when 3 arrives
+    assert calls == [1, 2, 3, 2]
+
+    expiring = server._ttl_cached(tool, ttl=0.0)
+    expiring(args={"n": 9})
+    expiring(args={"n": 9})
+    assert calls[-2:] == [9, 9]
+
+
+def test_ttl_cache_hits_are_isolated_from_caller_mutation():
+    cached = server._ttl_cached(lambda *, args: {"success": True, "result": 1, "error": None})
+    first = cached(args={})
+    first["result"] = "changed"
+    second = cached(args={})
+    second["error"] = "changed"
+    assert cached(args={}) == {"success": True, "result": 1, "error": None}
+
+
+def test_call_works_without_lifespan_startup():
+    from fastapi.testclient import TestClient
+
+    client = TestClient(server.app)  # not entered: no startup hooks run
+    assert client.post("/call", json={"tool_name": "nope"}).status_code == 404
+    response = client.post("/call", json={"tool_name": "app_manager", "args": {"action": "bogus"}})
+    assert response.status_code == 200
+    assert response.json()["tool_name"] == "app_manager"
+
+
+@pytest.mark.parametrize("query, binary", [("", False), ("?batch=1", False), ("?binary=1", True), ("?batch=1&binary=1", True)])
+def test_websocket_sends_text_frames_unless_binary_requested(query, binary):
+    from fastapi.testclient import TestClient
+
+    with TestClient(server.app).websocket_connect("/ws" + query) as websocket:
+        websocket.send_text('{"id": 1, "tool_name": "nope"}')
+        message = websocket.receive()
+    assert ("bytes" in message and message["bytes"] is not None) == binary
+    payload = orjson.loads(message["bytes"] if binary else message["text"])
+    response = payload[0] if "batch" in query else payload
+    assert response["id"] == 1 and response["success"] is False
+
+
+def test_tools_detail_lists_every_tool_with_metadata():
+    from fastapi.testclient import TestClient
+
+    client = TestClient(server.app)
+    assert set(client.get("/tools").json()) == {"consolidated_tools", "legacy_tools", "total_count", "recommended"}
+    payload = client.get("/tools", params={"detail": 1}).json()
+    assert payload["total_count"] == len(server.ALL_TOOLS)
+    entry = next(tool for tool in payload["tools"] if tool["name"] == "app_manager")
+    assert entry["category"] == "app" and "app manager" in entry["description"].lower()
+    assert client.get("/tools", params={"detail": 1}).content == server._tools_metadata_bytes()
@@ -2,12 +2,75 @@
 App Tools - Consolidated application management for AI agents
 Provides unified app control and window management capabilities.
 """
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from operator import itemgetter
+import heapq
 import subprocess
 import platform
+import re
 import os
+import shutil
 import signal
-import psutil
+import threading
+import time
+
+# Platform never changes at runtime; uname() once instead of on every call
+_SYSTEM = platform.system()
+
+# Simple heuristic for GUI applications: substrings of process names, compiled
+# into one alternation so each name is scanned once rather than once per entry
+_GUI_APP_NAMES = ("chrome", "firefox", "code", "terminal", "nautilus", "explorer", "finder", "safari")
+_GUI_RE = re.compile("|".join(map(re.escape, _GUI_APP_NAMES)), re.IGNORECASE)
+_BY_MEMORY = itemgetter("memory_mb")
+
+# Windows has no SIGKILL; os.kill terminates the process for any signal there
+_SIGKILL = getattr(signal, "SIGKILL", signal.SIGTERM)
+_HAVE_KILLPG = hasattr(os, "killpg")
+
+# Window management CLIs, looked up once so a missing one never costs a failed exec
+_WMCTRL = shutil.which("wmctrl")
+_XDOTOOL = shutil.which("xdotool")
+_OSASCRIPT = shutil.which("osascript")
+_NO_WINDOW_CLI = {"success": False, "result": None, "error": "No window manager CLI available (install wmctrl or xdotool)"}
+
+# Launchers that take an app name as their last argument, resolved once;
+# ones that aren't installed are left out entirely
+_GTK_LAUNCH = shutil.which("gtk-launch")
+_PACKAGE_LAUNCHERS = tuple(
+    (path, "run") for path in (shutil.which("flatpak"), shutil.which("snap")) if path
+)
+
+# One process_iter scan, {pid: (name, rss_bytes, cpu_percent)}, shared by the
+# list and close-by-name paths so back-to-back calls don't each rescan /proc
+_PROC_SNAPSHOT_TTL = 0.25
+# Longest process name /proc/<pid>/comm holds (TASK_COMM_LEN - 1)
+_COMM_LEN = 15
+_proc_snapshot: Tuple[float, Dict[int, Tuple[Optional[str], Optional[int], Optional[float]]]] = (0.0, {})
+
+# Linux scans read /proc/<pid>/stat directly; CPU usage is the change in
+# utime+stime since the previous scan, as psutil's cpu_percent() computes it
+if _SYSTEM == "Linux":
+    _CLK_TCK = os.sysconf("SC_CLK_TCK")
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+_cpu_ticks: Tuple[float, Dict[int, int]] = (0.0, {})
+# From the ')' closing comm: state, 10 fields, utime, stime, 8 fields, rss
+_STAT_FIELDS_RE = re.compile(rb"\) \S+(?: \S+){10} (\d+) (\d+)(?: \S+){8} (\d+)")
+# From the ')' closing comm: state, ppid, pgrp
+_STAT_PGRP_RE = re.compile(rb"\) \S+ \S+ (\d+)")
+
+# Executables found on PATH for app launches; misses aren't kept, so an app
+# installed while the server runs is picked up on the next launch
+_RESOLVED_EXECUTABLES_MAX = 256
+_resolved_executables: Dict[str, str] = {}
+
+# Background launches started with posix_spawn, reaped on later launches;
+# the lock keeps concurrent launches from reaping the same PID twice
+_spawned_pids: Set[int] = set()
+_spawned_lock = threading.Lock()
+# Python ignores these at startup; reset them in children as subprocess does
+_SPAWN_SIGDEF = tuple(
+    getattr(signal, name) for name in ("SIGPIPE", "SIGXFSZ") if hasattr(signal, name)
+)
 
 def app_manager(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Universal app manager - replaces open_app, close_app, switch_app, list_apps, get_active_window, resize_window, pin_window, mute_app_audio
@@ -17,6 +80,7 @@ def app_manager(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
         name (str): Application name for open/close/switch operations
         pid (int): Process ID for close operations
         width, height (int): Dimensions for resize operations
+        top_n (int): For 'list', return only the N apps using the most memory
         
     Returns:
         Dict with operation result
@@ -27,28 +91,14 @@ def app_manager(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     action = args["action"]
     
     try:
-        if action == "open":
-            return _open_app_impl(args)
-        elif action == "close":
-            return _close_app_impl(args)
-        elif action == "switch":
-            return _switch_app_impl(args)
-        elif action == "list":
-            return _list_apps_impl(args)
-        elif action == "active":
-            return _get_active_window_impl(args)
-        elif action == "resize":
-            return _resize_window_impl(args)
-        elif action == "pin":
-            return _pin_window_impl(args)
-        elif action == "mute":
-            return _mute_app_impl(args)
-        else:
+        handler = _APP_HANDLERS.get(action)
+        if handler is None:
             return {
                 "success": False,
                 "result": None,
                 "error": f"Unknown action: {action}. Use: open, close, switch, list, active, resize, pin, mute"
             }
+        return handler(args)
     
     except Exception as e:
         return {"success": False, "result": None, "error": f"App operation failed: {str(e)}"}
@@ -71,26 +121,14 @@ def window_control(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     action = args["action"]
     
     try:
-        if action == "resize":
-            return _resize_window_impl(args)
-        elif action == "pin":
-            return _pin_window_impl(args)
-        elif action == "screenshot":
-            return _take_window_screenshot_impl(args)
-        elif action == "switch":
-            return _switch_window_impl(args)
-        elif action == "move":
-            return _move_window_impl(args)
-        elif action == "minimize":
-            return _minimize_window_impl(args)
-        elif action == "maximize":
-            return _maximize_window_impl(args)
-        else:
+        handler = _WINDOW_HANDLERS.get(action)
+        if handler is None:
             return {
                 "success": False,
                 "result": None,
                 "error": f"Unknown action: {action}. Use: resize, pin, screenshot, switch, move, minimize, maximize"
             }
+        return handler(args)
     
     except Exception as e:
         return {"success": False, "result": None, "error": f"Window operation failed: {str(e)}"}
@@ -104,29 +142,18 @@ def _open_app_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     
     try:
         wait_for_launch = args.get("wait_for_launch", False)
-        system = platform.system()
         
-        if system == "Linux":
-            # Try different methods to launch apps on Linux
-            launch_commands = [
-                [name],  # Direct command
-                ["gtk-launch", name],  # GTK launcher
-                ["/usr/bin/" + name],  # Common bin path
-                ["/usr/local/bin/" + name],  # Local bin path
-                ["flatpak", "run", name],  # Flatpak apps
-                ["snap", "run", name],  # Snap apps
-            ]
-            
-            for cmd in launch_commands:
+        if _SYSTEM == "Linux":
+            for cmd in _linux_launch_commands(name):
                 try:
                     if wait_for_launch:
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+                        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=10)
                         if result.returncode == 0:
                             return {
                                 "success": True,
                                 "result": {
                                     "app_name": name,
-                                    "command": " ".join(cmd),
+                                    "command": cmd,
                                     "launched": True,
                                     "method": "linux_native"
                                 },
@@ -134,21 +161,21 @@ def _open_app_impl(args: Dict[str, Any]) -> Dict[str, Any]:
                             }
                     else:
                         # Launch in background
-                        subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                        _spawn_detached(cmd)
                         return {
                             "success": True,
                             "result": {
                                 "app_name": name,
-                                "command": " ".join(cmd),
+                                "command": cmd,
                                 "launched": True,
                                 "method": "linux_background"
                             },
                             "error": None
                         }
-                except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
+                except (subprocess.TimeoutExpired, OSError, subprocess.SubprocessError):
                     continue
                     
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             try:
                 subprocess.run(["open", "-a", name], check=True)
                 return {
@@ -159,7 +186,7 @@ def _open_app_impl(args: Dict[str, Any]) -> Dict[str, Any]:
             except subprocess.CalledProcessError:
                 pass
                 
-        elif system == "Windows":
+        elif _SYSTEM == "Windows":
             try:
                 subprocess.run(["start", name], shell=True, check=True)
                 return {
@@ -175,8 +202,237 @@ def _open_app_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"success": False, "result": None, "error": f"Failed to open app: {str(e)}"}
 
+def _which(name: str) -> Optional[str]:
+    """shutil.which, remembering only hits so apps installed later are still found"""
+    path = _resolved_executables.get(name)
+    if path is None:
+        path = shutil.which(name)
+        if path is not None:
+            if len(_resolved_executables) >= _RESOLVED_EXECUTABLES_MAX:
+                _resolved_executables.clear()
+            _resolved_executables[name] = path
+    return path
+
+def _linux_launch_commands(name: str) -> Tuple[Tuple[str, ...], ...]:
+    """Launch commands for an app on Linux, in order of preference
+    
+    Only commands whose executable exists are returned, so launching never
+    forks just to fail with FileNotFoundError.
+    """
+    commands = []
+    direct = _which(name)  # Direct command
+    if direct:
+        commands.append((direct,))
+    if _GTK_LAUNCH:
+        commands.append((_GTK_LAUNCH, name))  # GTK launcher
+    for path in ("/usr/bin/" + name, "/usr/local/bin/" + name):  # Common bin paths
+        if path != direct and _which(path):
+            commands.append((path,))
+    # Flatpak and snap apps
+    commands.extend(launcher + (name,) for launcher in _PACKAGE_LAUNCHERS)
+    return tuple(commands)
+
+def _spawn_detached(cmd: Tuple[str, ...]) -> int:
+    """Start cmd in its own session with output discarded, via posix_spawn
+    
+    cmd[0] must be a resolved path. Children from earlier launches that have
+    exited are reaped here, as subprocess does for dropped Popen objects.
+    """
+    with _spawned_lock:
+        for pid in list(_spawned_pids):
+            try:
+                if os.waitpid(pid, os.WNOHANG)[0]:
+                    _spawned_pids.discard(pid)
+            except ChildProcessError:
+                _spawned_pids.discard(pid)
+    
+    pid = os.posix_spawn(cmd[0], cmd, os.environ, file_actions=[
+        (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+        (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+    ], setsid=True, setsigdef=_SPAWN_SIGDEF)
+    with _spawned_lock:
+        _spawned_pids.add(pid)
+    return pid
+
+def _process_snapshot(ttl: float = _PROC_SNAPSHOT_TTL) -> Dict[int, Tuple[Optional[str], Optional[int], Optional[float]]]:
+    """Return the shared process snapshot, rescanning if older than ttl seconds"""
+    global _proc_snapshot
+    taken_at, snapshot = _proc_snapshot
+    now = time.monotonic()
+    if now - taken_at < ttl:
+        return snapshot
+    
+    if _SYSTEM == "Linux":
+        snapshot = _linux_process_snapshot(now)
+        _proc_snapshot = (now, snapshot)
+        return snapshot
+    
+    # Imported here: psutil is slow to import and only this fallback uses it
+    import psutil
+    
+    snapshot = {}
+    # attrs= prefetches proc.info in one pass; ad_value fills in attributes
+    # we are denied instead of raising
+    for proc in psutil.process_iter(attrs=['pid', 'name', 'memory_info', 'cpu_percent'], ad_value=None):
+        info = proc.info
+        memory_info = info['memory_info']
+        snapshot[info['pid']] = (info['name'], memory_info.rss if memory_info else None, info['cpu_percent'])
+    _proc_snapshot = (now, snapshot)
+    return snapshot
+
+def _linux_process_snapshot(now: float) -> Dict[int, Tuple[Optional[str], Optional[int], Optional[float]]]:
+    """Build the process snapshot from one read of /proc/<pid>/stat per process
+    
+    psutil opens stat and statm separately for name, memory and CPU times;
+    stat alone carries all three (comm, utime/stime, rss in pages).
+    """
+    global _cpu_ticks
+    ticks_at, previous_ticks = _cpu_ticks
+    elapsed = now - ticks_at
+    ticks = {}
+    snapshot = {}
+    # Hoist per-process global/attribute lookups out of the loop
+    parse_stat = _parse_stat_bytes
+    previous_get = previous_ticks.get
+    page_size = _PAGE_SIZE
+    percent_per_tick = 100 / (_CLK_TCK * elapsed) if elapsed > 0 else 0.0
+    for entry in os.scandir("/proc"):
+        name = entry.name
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "rb", buffering=0) as f:
+                data = f.read(4096)
+        except OSError:  # exited since the scandir
+            continue
+        
+        parsed = parse_stat(data)
+        if parsed is None:
+            continue
+        comm, cpu_ticks, rss_pages = parsed
+        pid = int(name)
+        ticks[pid] = cpu_ticks
+        
+        previous = previous_get(pid)
+        cpu_percent = 0.0 if previous is None else round((cpu_ticks - previous) * percent_per_tick, 1)
+        snapshot[pid] = (_linux_full_name(name, comm), rss_pages * page_size, cpu_percent)
+    
+    _cpu_ticks = (now, ticks)
+    return snapshot
+
+def _parse_stat_bytes(data: bytes) -> Optional[Tuple[bytes, int, int]]:
+    """Pull (comm, utime + stime ticks, rss pages) out of a /proc/<pid>/stat buffer
+    
+    Works on the raw bytes: the three numeric fields are captured by one regex
+    match at the last ')' (comm may itself contain spaces or parentheses)
+    rather than splitting the line into ~50 field objects.
+    """
+    close = data.rfind(b")")
+    match = _STAT_FIELDS_RE.match(data, close)
+    if match is None:
+        return None
+    utime, stime, rss = match.groups()
+    return data[data.find(b"(") + 1:close], int(utime) + int(stime), int(rss)
+
+def _linux_full_name(pid: str, comm: bytes) -> str:
+    """Decode comm, recovering the full name from cmdline if comm was truncated
+    
+    The kernel cuts comm to 15 bytes. When it is exactly that long, the
+    basename of argv[0] is used instead if it starts with comm, as psutil does.
+    """
+    name = comm.decode("utf-8", "replace")
+    if len(comm) < _COMM_LEN:
+        return name
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb", buffering=0) as f:
+            argv0 = f.read(4096).split(b"\0", 1)[0]
+    except OSError:  # exited, or a kernel thread
+        return name
+    full_name = os.path.basename(argv0.decode("utf-8", "replace"))
+    return full_name if full_name.startswith(name) else name
+
+def _linux_pids_by_name(needle: str) -> Iterator[Tuple[int, str]]:
+    """Yield (pid, name) for processes whose name contains needle (lowercase)
+    
+    Reads only /proc/<pid>/comm, a few bytes per process, instead of having
+    psutil build a Process and parse /proc/<pid>/stat for each one; cmdline
+    is read as well only for names comm may have truncated.
+    """
+    for entry in os.scandir("/proc"):
+        pid = entry.name
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/comm", "rb", buffering=0) as f:
+                comm = f.read(64).rstrip(b"\n")
+        except OSError:  # exited since the scandir, or not readable
+            continue
+        name = _linux_full_name(pid, comm)
+        if needle in name.lower():
+            yield int(pid), name
+
+def _linux_group_pids(pgid: int) -> Optional[Set[int]]:
+    """Return the PIDs currently in process group pgid, or None if not listable"""
+    if _SYSTEM != "Linux":
+        return None
+    members = set()
+    for entry in os.scandir("/proc"):
+        name = entry.name
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat", "rb", buffering=0) as f:
+                data = f.read(4096)
+        except OSError:  # exited since the scandir
+            continue
+        match = _STAT_PGRP_RE.match(data, data.rfind(b")"))
+        if match is not None and int(match.group(1)) == pgid:
+            members.add(int(name))
+    return members
+
+def _signal_processes(matches: Iterable[Tuple[int, str]], sig: int) -> List[Tuple[int, str]]:
+    """Send sig to each (pid, name) in matches; return the ones signalled
+    
+    Where every member of a process group is among the matches (a
+    multi-process app and its helpers), the group gets a single killpg so it
+    is signalled as a whole. Groups that also hold unmatched processes, whose
+    membership can't be listed, or that are our own, are signalled per PID.
+    """
+    groups: Dict[Optional[int], List[Tuple[int, str]]] = {}
+    own_group = None
+    if not _HAVE_KILLPG:
+        groups[None] = list(matches)
+    else:
+        for pid, proc_name in matches:
+            try:
+                pgid = os.getpgid(pid)
+            except ProcessLookupError:
+                continue
+            groups.setdefault(pgid, []).append((pid, proc_name))
+        own_group = os.getpgrp()
+    
+    signalled = []
+    for pgid, members in groups.items():
+        if pgid is not None and pgid != own_group and len(members) > 1:
+            group_pids = _linux_group_pids(pgid)
+            if group_pids is not None and group_pids <= {pid for pid, _ in members}:
+                try:
+                    os.killpg(pgid, sig)
+                    signalled.extend(members)
+                    continue
+                except (ProcessLookupError, PermissionError):
+                    pass  # Fall back to signalling members one by one
+        for pid, proc_name in members:
+            try:
+                os.kill(pid, sig)
+            except (ProcessLookupError, PermissionError):
+                continue
+            signalled.append((pid, proc_name))
+    return signalled
+
 def _close_app_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Close application implementation"""
+    global _proc_snapshot
     if "name" not in args and "pid" not in args:
         return {"success": False, "result": None, "error": "Missing required argument: name or pid"}
     
@@ -186,43 +442,47 @@ def _close_app_impl(args: Dict[str, Any]) -> Dict[str, Any]:
         if "pid" in args:
             # Close by PID
             pid = args["pid"]
+            # os.kill treats 0 and negative PIDs as process groups
+            if pid <= 0:
+                return {"success": False, "result": None, "error": f"Process with PID {pid} not found"}
             try:
-                process = psutil.Process(pid)
-                if force:
-                    process.kill()
-                else:
-                    process.terminate()
+                # Signal directly; building a psutil.Process would parse /proc/<pid>/stat first
+                os.kill(pid, _SIGKILL if force else signal.SIGTERM)
                     
                 return {
                     "success": True,
                     "result": {"pid": pid, "action": "killed" if force else "terminated"},
                     "error": None
                 }
-            except psutil.NoSuchProcess:
+            except ProcessLookupError:
                 return {"success": False, "result": None, "error": f"Process with PID {pid} not found"}
-            except psutil.AccessDenied:
+            except PermissionError:
                 return {"success": False, "result": None, "error": f"Access denied to process {pid}"}
         
         elif "name" in args:
             # Close by name
             name = args["name"]
+            needle = name.lower()
             killed_processes = []
             
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
-                try:
-                    if name.lower() in proc.info['name'].lower():
-                        if force:
-                            proc.kill()
-                        else:
-                            proc.terminate()
-                        killed_processes.append({
-                            "pid": proc.info['pid'],
-                            "name": proc.info['name']
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            sig = _SIGKILL if force else signal.SIGTERM
+            if _SYSTEM == "Linux" and time.monotonic() - _proc_snapshot[0] >= _PROC_SNAPSHOT_TTL:
+                # No fresh snapshot to reuse: a comm-only scan is all we need
+                matches = _linux_pids_by_name(needle)
+            else:
+                matches = (
+                    (pid, proc_name) for pid, (proc_name, _, _) in _process_snapshot().items()
+                    if proc_name and needle in proc_name.lower()
+                )
+            for pid, proc_name in _signal_processes(matches, sig):
+                killed_processes.append({
+                    "pid": pid,
+                    "name": proc_name
+                })
             
             if killed_processes:
+                # The snapshot still lists the processes we just signalled
+                _proc_snapshot = (0.0, {})
                 return {
                     "success": True,
                     "result": {
@@ -246,37 +506,35 @@ def _switch_app_impl(args: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "result": None, "error": "Missing required argument: name"}
     
     try:
-        system = platform.system()
-        
-        if system == "Linux":
+        if _SYSTEM == "Linux":
+            if _WMCTRL is None and _XDOTOOL is None:
+                return dict(_NO_WINDOW_CLI)
+            
             # Use wmctrl to switch to window
-            try:
-                result = subprocess.run(["wmctrl", "-a", name], capture_output=True, text=True)
+            if _WMCTRL:
+                result = subprocess.run([_WMCTRL, "-a", name], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 if result.returncode == 0:
                     return {
                         "success": True,
                         "result": {"app_name": name, "switched": True, "method": "wmctrl"},
                         "error": None
                     }
-            except FileNotFoundError:
-                pass
             
             # Try xdotool as fallback
-            try:
-                result = subprocess.run(["xdotool", "search", "--name", name, "windowactivate"], capture_output=True, text=True)
+            if _XDOTOOL:
+                result = subprocess.run([_XDOTOOL, "search", "--name", name, "windowactivate"],
+                                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
                 if result.returncode == 0:
                     return {
                         "success": True,
                         "result": {"app_name": name, "switched": True, "method": "xdotool"},
                         "error": None
                     }
-            except FileNotFoundError:
-                pass
                 
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin" and _OSASCRIPT:  # macOS
             try:
                 script = f'tell application "{name}" to activate'
-                subprocess.run(["osascript", "-e", script], check=True)
+                subprocess.run([_OSASCRIPT, "-e", script], check=True)
                 return {
                     "success": True,
                     "result": {"app_name": name, "switched": True, "method": "applescript"},
@@ -298,22 +556,22 @@ def _list_apps_impl(args: Dict[str, Any]) -> Dict[str, Any]:
         if running_only:
             # List running applications
             apps = []
-            for proc in psutil.process_iter(['pid', 'name', 'memory_info', 'cpu_percent']):
-                try:
-                    # Simple heuristic for GUI applications
-                    name = proc.info['name'].lower()
-                    if any(gui_app in name for gui_app in ['chrome', 'firefox', 'code', 'terminal', 'nautilus', 'explorer', 'finder', 'safari']):
-                        apps.append({
-                            "pid": proc.info['pid'],
-                            "name": proc.info['name'],
-                            "memory_mb": round(proc.info['memory_info'].rss / 1024 / 1024, 1),
-                            "cpu_percent": proc.info['cpu_percent']
-                        })
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
+            for pid, (name, rss, cpu_percent) in _process_snapshot().items():
+                # Skip processes whose memory we may not read, as before
+                if name and rss is not None and _GUI_RE.search(name):
+                    apps.append({
+                        "pid": pid,
+                        "name": name,
+                        "memory_mb": round(rss / 1048576, 1),
+                        "cpu_percent": cpu_percent
+                    })
             
-            # Sort by memory usage
-            apps.sort(key=lambda x: x['memory_mb'], reverse=True)
+            # Sort by memory usage; with top_n only the largest N are ordered
+            top_n = args.get("top_n")
+            if top_n:
+                apps = heapq.nlargest(top_n, apps, key=_BY_MEMORY)
+            else:
+                apps.sort(key=_BY_MEMORY, reverse=True)
             
             return {
                 "success": True,
@@ -338,30 +596,24 @@ def _list_apps_impl(args: Dict[str, Any]) -> Dict[str, Any]:
 def _get_active_window_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get active window implementation"""
     try:
-        system = platform.system()
-        
-        if system == "Linux":
-            # Try xdotool first
-            try:
-                result = subprocess.run(["xdotool", "getactivewindow", "getwindowname"], capture_output=True, text=True)
-                if result.returncode == 0:
-                    title = result.stdout.strip()
-                    
-                    # Get window ID and geometry
-                    id_result = subprocess.run(["xdotool", "getactivewindow"], capture_output=True, text=True)
-                    window_id = id_result.stdout.strip() if id_result.returncode == 0 else None
-                    
-                    return {
-                        "success": True,
-                        "result": {
-                            "title": title,
-                            "window_id": window_id,
-                            "method": "xdotool"
-                        },
-                        "error": None
-                    }
-            except FileNotFoundError:
-                pass
+        if _SYSTEM == "Linux" and _XDOTOOL:
+            # One chained xdotool run: getwindowname prints the title, and the
+            # trailing getactivewindow (last in the chain) prints the window ID
+            result = subprocess.run([_XDOTOOL, "getactivewindow", "getwindowname", "getactivewindow"],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+            # The ID line must be numeric; any other output shape is treated as a
+            # failure rather than risking a swapped or empty title and ID
+            title, _, window_id = result.stdout.rstrip("\n").rpartition("\n")
+            if result.returncode == 0 and window_id.isdigit():
+                return {
+                    "success": True,
+                    "result": {
+                        "title": title,
+                        "window_id": window_id,
+                        "method": "xdotool"
+                    },
+                    "error": None
+                }
         
         return {"success": False, "result": None, "error": "Could not get active window"}
         
@@ -377,31 +629,34 @@ def _resize_window_impl(args: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "result": None, "error": "Missing required arguments: width, height"}
     
     try:
-        system = platform.system()
         window_title = args.get("window_title")
         
-        if system == "Linux":
+        if _SYSTEM == "Linux":
             if window_title:
                 # Resize specific window
+                if _WMCTRL is None:
+                    return dict(_NO_WINDOW_CLI)
                 try:
-                    subprocess.run(["wmctrl", "-r", window_title, "-e", f"0,-1,-1,{width},{height}"], check=True)
+                    subprocess.run([_WMCTRL, "-r", window_title, "-e", f"0,-1,-1,{width},{height}"], check=True)
                     return {
                         "success": True,
                         "result": {"window_title": window_title, "width": width, "height": height, "method": "wmctrl"},
                         "error": None
                     }
-                except (FileNotFoundError, subprocess.CalledProcessError):
+                except subprocess.CalledProcessError:
                     pass
             else:
                 # Resize active window
+                if _XDOTOOL is None:
+                    return dict(_NO_WINDOW_CLI)
                 try:
-                    subprocess.run(["xdotool", "getactivewindow", "windowsize", str(width), str(height)], check=True)
+                    subprocess.run([_XDOTOOL, "getactivewindow", "windowsize", str(width), str(height)], check=True)
                     return {
                         "success": True,
                         "result": {"width": width, "height": height, "method": "xdotool"},
                         "error": None
                     }
-                except (FileNotFoundError, subprocess.CalledProcessError):
+                except subprocess.CalledProcessError:
                     pass
         
         return {"success": False, "result": None, "error": "Could not resize window"}
@@ -411,25 +666,19 @@ def _resize_window_impl(args: Dict[str, Any]) -> Dict[str, Any]:
 
 def _pin_window_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Pin window implementation"""
-    try:
-        return {
-            "success": False,
-            "result": None,
-            "error": "Window pinning not yet implemented"
-        }
-    except Exception as e:
-        return {"success": False, "result": None, "error": f"Failed to pin window: {str(e)}"}
+    return {
+        "success": False,
+        "result": None,
+        "error": "Window pinning not yet implemented"
+    }
 
 def _mute_app_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Mute application implementation"""
-    try:
-        return {
-            "success": False,
-            "result": None,
-            "error": "App audio muting not yet implemented"
-        }
-    except Exception as e:
-        return {"success": False, "result": None, "error": f"Failed to mute app: {str(e)}"}
+    return {
+        "success": False,
+        "result": None,
+        "error": "App audio muting not yet implemented"
+    }
 
 def _take_window_screenshot_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Take window screenshot implementation"""
@@ -461,17 +710,17 @@ def _move_window_impl(args: Dict[str, Any]) -> Dict[str, Any]:
         return {"success": False, "result": None, "error": "Missing required arguments: x, y"}
     
     try:
-        system = platform.system()
-        
-        if system == "Linux":
+        if _SYSTEM == "Linux":
+            if _XDOTOOL is None:
+                return dict(_NO_WINDOW_CLI)
             try:
-                subprocess.run(["xdotool", "getactivewindow", "windowmove", str(x), str(y)], check=True)
+                subprocess.run([_XDOTOOL, "getactivewindow", "windowmove", str(x), str(y)], check=True)
                 return {
                     "success": True,
                     "result": {"x": x, "y": y, "method": "xdotool"},
                     "error": None
                 }
-            except (FileNotFoundError, subprocess.CalledProcessError):
+            except subprocess.CalledProcessError:
                 pass
         
         return {"success": False, "result": None, "error": "Could not move window"}
@@ -482,17 +731,17 @@ def _move_window_impl(args: Dict[str, Any]) -> Dict[str, Any]:
 def _minimize_window_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Minimize window implementation"""
     try:
-        system = platform.system()
-        
-        if system == "Linux":
+        if _SYSTEM == "Linux":
+            if _XDOTOOL is None:
+                return dict(_NO_WINDOW_CLI)
             try:
-                subprocess.run(["xdotool", "getactivewindow", "windowminimize"], check=True)
+                subprocess.run([_XDOTOOL, "getactivewindow", "windowminimize"], check=True)
                 return {
                     "success": True,
                     "result": {"action": "minimized", "method": "xdotool"},
                     "error": None
                 }
-            except (FileNotFoundError, subprocess.CalledProcessError):
+            except subprocess.CalledProcessError:
                 pass
         
         return {"success": False, "result": None, "error": "Could not minimize window"}
@@ -503,17 +752,17 @@ def _minimize_window_impl(args: Dict[str, Any]) -> Dict[str, Any]:
 def _maximize_window_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Maximize window implementation"""
     try:
-        system = platform.system()
-        
-        if system == "Linux":
+        if _SYSTEM == "Linux":
+            if _XDOTOOL is None:
+                return dict(_NO_WINDOW_CLI)
             try:
-                subprocess.run(["xdotool", "getactivewindow", "windowmaximize"], check=True)
+                subprocess.run([_XDOTOOL, "getactivewindow", "windowmaximize"], check=True)
                 return {
                     "success": True,
                     "result": {"action": "maximized", "method": "xdotool"},
                     "error": None
                 }
-            except (FileNotFoundError, subprocess.CalledProcessError):
+            except subprocess.CalledProcessError:
                 pass
         
         return {"success": False, "result": None, "error": "Could not maximize window"}
@@ -521,43 +770,72 @@ def _maximize_window_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"success": False, "result": None, "error": f"Failed to maximize window: {str(e)}"}
 
+# Action dispatch tables for app_manager and window_control
+_APP_HANDLERS = {
+    "open": _open_app_impl,
+    "close": _close_app_impl,
+    "switch": _switch_app_impl,
+    "list": _list_apps_impl,
+    "active": _get_active_window_impl,
+    "resize": _resize_window_impl,
+    "pin": _pin_window_impl,
+    "mute": _mute_app_impl,
+}
+
+_WINDOW_HANDLERS = {
+    "resize": _resize_window_impl,
+    "pin": _pin_window_impl,
+    "screenshot": _take_window_screenshot_impl,
+    "switch": _switch_window_impl,
+    "move": _move_window_impl,
+    "minimize": _minimize_window_impl,
+    "maximize": _maximize_window_impl,
+}
+
 # Legacy function aliases for backward compatibility
+def _safe(handler, args: Dict[str, Any], failure: str) -> Dict[str, Any]:
+    """Call an action handler directly, with the same error wrapping as its dispatcher"""
+    try:
+        return handler(args)
+    except Exception as e:
+        return {"success": False, "result": None, "error": f"{failure}: {str(e)}"}
+
 def open_app(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use app_manager instead"""
-    return app_manager(args={"action": "open", **(args or {})})
+    return _safe(_open_app_impl, args or {}, "App operation failed")
 
 def close_app(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use app_manager instead"""
-    return app_manager(args={"action": "close", **(args or {})})
+    return _safe(_close_app_impl, args or {}, "App operation failed")
 
 def switch_app(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use app_manager instead"""
-    return app_manager(args={"action": "switch", **(args or {})})
+    return _safe(_switch_app_impl, args or {}, "App operation failed")
 
 def list_apps(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use app_manager instead"""
-    return app_manager(args={"action": "list", **(args or {})})
+    return _safe(_list_apps_impl, args or {}, "App operation failed")
 
 def get_active_window(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use app_manager instead"""
-    return app_manager(args={"action": "active", **(args or {})})
+    return _safe(_get_active_window_impl, args or {}, "App operation failed")
 
 def resize_window(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use window_control instead"""
-    return window_control(args={"action": "resize", **(args or {})})
+    return _safe(_resize_window_impl, args or {}, "Window operation failed")
 
 def take_window_screenshot(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use window_control instead"""
-    return window_control(args={"action": "screenshot", **(args or {})})
+    return _safe(_take_window_screenshot_impl, args or {}, "Window operation failed")
 
 def pin_window(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use window_control instead"""
-    return window_control(args={"action": "pin", **(args or {})})
+    return _safe(_pin_window_impl, args or {}, "Window operation failed")
 
 def mute_app_audio(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use app_manager instead"""
-    return app_manager(args={"action": "mute", **(args or {})})
+    return _safe(_mute_app_impl, args or {}, "App operation failed")
 
 def list_running_apps(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use app_manager instead"""
-    return app_manager(args={"action": "list", "running_only": True, **(args or {})})
+    return _safe(_list_apps_impl, {"running_only": True, **(args or {})}, "App operation failed")
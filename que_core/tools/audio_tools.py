@@ -2,21 +2,58 @@
 Audio Tools - Consolidated audio operations and media processing for AI agents
 Provides unified audio control and media processing capabilities.
 """
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from functools import lru_cache
+import asyncio
+import atexit
 import os
 import platform
+import queue
+import re
+import shutil
 import subprocess
 import tempfile
+import threading
+import time
 import json
 
+# Platform never changes at runtime; uname() once instead of on every call
+_SYSTEM = platform.system()
+
+# Volume percentage in `amixer sget` output, e.g. "[75%]"
+_AMIXER_VOLUME_RE = re.compile(r'\[(\d+)%\]')
+
+# Device lines in `arecord -l` / `aplay -l` output, e.g. "card 0: PCH [...], device 0: ..."
+_ALSA_DEVICE_RE = re.compile(r'^card\b.*\bdevice\b.*$', re.MULTILINE)
+
+# Streaming transcription: 1 s chunks of 16 kHz mono samples are collected for
+# up to half a chunk and sent through the model together, at most 256 at a time
+_STREAM_SAMPLE_RATE = 16000
+_STREAM_CHUNK_SAMPLES = _STREAM_SAMPLE_RATE
+_STREAM_WINDOW = 0.5
+_STREAM_BATCH_MAX = 256
+_stream_queue: "queue.Queue[Tuple[Any, str, Optional[str], Any, Future]]" = queue.Queue()
+_stream_worker: Optional[threading.Thread] = None
+_stream_lock = threading.Lock()
+
+# One pyttsx3 engine serves every speak call; it is not thread-safe
+_tts_lock = threading.Lock()
+
+# Device listings only change on hardware changes; reuse one for a few seconds
+_DEVICES_CACHE_TTL = 5.0
+_devices_cache: Tuple[float, Optional[List[Dict[str, str]]]] = (0.0, None)
+
 def audio_control(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Universal audio controller - replaces record_audio, play_audio, transcribe_audio, speak_text, list_audio_devices, adjust_mic_gain, adjust_speaker_volume
     
     Args:
-        action (str): Action to perform - 'record', 'play', 'speak', 'transcribe', 'list_devices', 'set_volume', 'get_volume'
+        action (str): Action to perform - 'record', 'play', 'speak', 'transcribe', 'transcribe_stream', 'list_devices', 'set_volume', 'get_volume'
         duration (int): Recording duration in seconds (for 'record')
-        file (str): Audio file path (for 'play', 'transcribe')
+        file (str): Audio file path (for 'play', 'transcribe'; a list of paths for batch 'transcribe')
         text (str): Text to speak (for 'speak')
+        chunk (list): Up to 1 s of 16 kHz mono float samples (for 'transcribe_stream')
+        call_id (str): Caller tag echoed back with the chunk's text (for 'transcribe_stream')
         output_path (str): Output file path (for 'record')
         volume (int): Volume level 0-100 (for 'set_volume')
         device (str): Audio device name (optional)
@@ -25,463 +62,768 @@ def audio_control(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
         Dict with operation result
     """
     if not args or "action" not in args:
-        return {"success": False, "result": None, "error": "Missing required argument: action"}
+        return _err("Missing required argument: action")
     
     action = args["action"]
     
     try:
-        if action == "record":
-            return _record_audio_impl(args)
-        elif action == "play":
-            return _play_audio_impl(args)
-        elif action == "speak":
-            return _speak_text_impl(args)
-        elif action == "transcribe":
-            return _transcribe_audio_impl(args)
-        elif action == "list_devices":
-            return _list_audio_devices_impl(args)
-        elif action == "set_volume":
-            return _set_volume_impl(args)
-        elif action == "get_volume":
-            return _get_volume_impl(args)
-        else:
-            return {
-                "success": False,
-                "result": None,
-                "error": f"Unknown action: {action}. Use: record, play, speak, transcribe, list_devices, set_volume, get_volume"
-            }
+        handler = _AUDIO_HANDLERS.get(action)
+        if handler is None:
+            return _err(f"Unknown action: {action}. Use: record, play, speak, transcribe, transcribe_stream, list_devices, set_volume, get_volume")
+        return handler(args)
     
     except Exception as e:
-        return {"success": False, "result": None, "error": f"Audio operation failed: {str(e)}"}
+        return _err(f"Audio operation failed: {str(e)}")
 
 def media_processor(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Media processing engine - replaces transcribe_audio, analyze_scene, detect_faces, detect_objects
     
     Args:
         action (str): Action to perform - 'transcribe', 'analyze_scene', 'detect_faces', 'detect_objects', 'extract_audio'
-        file (str): Media file path
+        file (str): Media file path (a list of paths for batch 'transcribe')
         image (str): Image file path (for vision tasks)
         language (str): Language for transcription (optional)
         confidence_threshold (float): Detection confidence threshold (optional)
+        sample_rate (int): Extracted audio sample rate, default 16000 (for 'extract_audio')
+        channels (int): Extracted audio channel count, default 1 (for 'extract_audio')
         
     Returns:
         Dict with processing result
     """
     if not args or "action" not in args:
-        return {"success": False, "result": None, "error": "Missing required argument: action"}
+        return _err("Missing required argument: action")
     
     action = args["action"]
     
     try:
-        if action == "transcribe":
-            return _transcribe_media_impl(args)
-        elif action == "analyze_scene":
-            return _analyze_scene_impl(args)
-        elif action == "detect_faces":
-            return _detect_faces_impl(args)
-        elif action == "detect_objects":
-            return _detect_objects_impl(args)
-        elif action == "extract_audio":
-            return _extract_audio_impl(args)
-        else:
-            return {
-                "success": False,
-                "result": None,
-                "error": f"Unknown action: {action}. Use: transcribe, analyze_scene, detect_faces, detect_objects, extract_audio"
-            }
+        handler = _MEDIA_HANDLERS.get(action)
+        if handler is None:
+            return _err(f"Unknown action: {action}. Use: transcribe, analyze_scene, detect_faces, detect_objects, extract_audio")
+        return handler(args)
+    
+    except Exception as e:
+        return _err(f"Media processing failed: {str(e)}")
+
+async def audio_control_async(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Awaitable audio_control, for callers already running an event loop
+    
+    'record' and 'play' await their recorder/player process instead of blocking
+    a thread on it; other actions run audio_control in a worker thread.
+    """
+    if not args or "action" not in args:
+        return _err("Missing required argument: action")
+    
+    handler = _AUDIO_HANDLERS_ASYNC.get(args["action"])
+    if handler is None:
+        return await asyncio.to_thread(audio_control, args=args)
+    try:
+        return await handler(args)
+    except Exception as e:
+        return _err(f"Audio operation failed: {str(e)}")
+
+async def media_processor_async(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Awaitable media_processor, for callers already running an event loop
     
+    'extract_audio' awaits ffmpeg instead of blocking a thread on it; other
+    actions run media_processor in a worker thread.
+    """
+    if not args or "action" not in args:
+        return _err("Missing required argument: action")
+    
+    handler = _MEDIA_HANDLERS_ASYNC.get(args["action"])
+    if handler is None:
+        return await asyncio.to_thread(media_processor, args=args)
+    try:
+        return await handler(args)
     except Exception as e:
-        return {"success": False, "result": None, "error": f"Media processing failed: {str(e)}"}
+        return _err(f"Media processing failed: {str(e)}")
 
 # Audio Control Implementation Helpers
+def _ok(result: Dict[str, Any], method: str) -> Dict[str, Any]:
+    """Successful tool response carrying result, tagged with method"""
+    return {"success": True, "result": {**result, "method": method}, "error": None}
+
+def _err(error: str) -> Dict[str, Any]:
+    """Failed tool response carrying error"""
+    return {"success": False, "result": None, "error": error}
+
+def _run(cmd: List[str], *, timeout: float, input: Optional[bytes] = None) -> subprocess.CompletedProcess:
+    """Run cmd for its exit status: stdout is discarded and stderr kept undecoded
+    
+    Use _stderr_text() to decode stderr only when reporting a failure. A
+    binary that isn't installed fails with exit status 127 without forking.
+    """
+    if not _has(cmd[0]):
+        return subprocess.CompletedProcess(cmd, 127, None, f"{cmd[0]}: command not found".encode())
+    return subprocess.run(cmd, input=input, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=timeout)
+
+async def _run_async(cmd: List[str], *, timeout: float, input: Optional[bytes] = None) -> subprocess.CompletedProcess:
+    """Awaitable _run(): same result, without a thread blocked on the child
+    
+    Raises subprocess.TimeoutExpired after killing the child, like _run().
+    """
+    if not _has(cmd[0]):
+        return subprocess.CompletedProcess(cmd, 127, None, f"{cmd[0]}: command not found".encode())
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE
+    )
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(input), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(cmd, proc.returncode, None, stderr)
+
+def _stderr_text(result: subprocess.CompletedProcess) -> str:
+    """Decoded stderr of a _run() result, for error messages"""
+    return result.stderr.decode(errors="replace") if result.stderr else ""
+
+def _run_concurrently(cmds: List[List[str]], *, timeout: float) -> List[Optional[str]]:
+    """Start every command before waiting on any, so they run side by side
+    
+    Returns each command's stdout, or None where it failed to start, exited
+    non-zero or was still running when the shared deadline passed.
+    """
+    procs = []
+    for cmd in cmds:
+        if not _has(cmd[0]):
+            procs.append(None)
+            continue
+        try:
+            procs.append(subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True))
+        except OSError:
+            procs.append(None)
+    
+    deadline = time.monotonic() + timeout
+    outputs = []
+    for proc in procs:
+        if proc is None:
+            outputs.append(None)
+            continue
+        try:
+            stdout, _ = proc.communicate(timeout=max(deadline - time.monotonic(), 0))
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            outputs.append(None)
+            continue
+        outputs.append(stdout if proc.returncode == 0 else None)
+    return outputs
+
+@lru_cache(maxsize=None)
+def _has(binary: str) -> bool:
+    """Whether binary is on PATH; looked up once per process (_has.cache_clear() to re-probe)"""
+    return shutil.which(binary) is not None
+
+def _first_available(candidates: Tuple[str, ...]) -> Optional[str]:
+    """Return the first of candidates installed on PATH, or None"""
+    return next((name for name in candidates if _has(name)), None)
+
+@lru_cache(maxsize=1)
+def _sound_modules() -> Optional[Tuple[Any, Any]]:
+    """(sounddevice, soundfile) for in-process record/play, or None if unavailable
+    
+    sounddevice raises OSError at import when the PortAudio library is missing.
+    """
+    try:
+        import sounddevice
+        import soundfile
+    except (ImportError, OSError):
+        return None
+    return sounddevice, soundfile
+
+@lru_cache(maxsize=1)
+def _pulsectl_module() -> Optional[Any]:
+    """pulsectl for talking to PulseAudio directly, or None if unavailable
+    
+    pulsectl raises OSError at import when libpulse itself is missing.
+    """
+    try:
+        import pulsectl
+    except (ImportError, OSError):
+        return None
+    return pulsectl
+
+# Speaks UTF-8 text read from stdin, so the script never changes between calls
+_SAPI_SPEAK_PS = """param([int]$Rate = 0)
+[Console]::InputEncoding = [System.Text.Encoding]::UTF8
+Add-Type -AssemblyName System.Speech
+$synth = New-Object System.Speech.Synthesis.SpeechSynthesizer
+$synth.Rate = $Rate
+$synth.Speak([Console]::In.ReadToEnd())
+"""
+
+@lru_cache(maxsize=1)
+def _sapi_speak_script() -> str:
+    """Path of the SAPI speak script, written once per process
+    
+    The script runs with -ExecutionPolicy Bypass, so it lives in a fresh
+    mkdtemp directory only this user can write to rather than at a fixed,
+    predictable path another user could swap or truncate.
+    """
+    directory = tempfile.mkdtemp(prefix="que_tools_")
+    atexit.register(shutil.rmtree, directory, ignore_errors=True)
+    path = os.path.join(directory, "speak.ps1")
+    with open(path, "x", encoding="utf-8") as f:
+        f.write(_SAPI_SPEAK_PS)
+    return path
+
+@lru_cache(maxsize=1)
+def _tts_engine() -> Optional[Tuple[Any, Any]]:
+    """(engine, default voice id) of the shared pyttsx3 engine, or None if unavailable
+    
+    Initialised once on first use; call with _tts_lock held.
+    """
+    try:
+        import pyttsx3
+        engine = pyttsx3.init()
+    except Exception:
+        # Not installed, or no usable speech driver on this system
+        return None
+    return engine, engine.getProperty("voice")
+
 def _record_audio_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Record audio implementation"""
     duration = args.get("duration")
     if not duration:
-        return {"success": False, "result": None, "error": "Missing required argument: duration"}
+        return _err("Missing required argument: duration")
     
     try:
-        output_path = args.get("output_path")
-        if not output_path:
-            output_path = os.path.join(tempfile.gettempdir(), f"recording_{duration}s.wav")
-        
-        sample_rate = args.get("sample_rate", 44100)
-        channels = args.get("channels", 1)
-        system = platform.system()
-        
-        if system == "Linux":
-            # Use arecord (ALSA)
-            cmd = [
-                "arecord", "-f", "cd", "-t", "wav", "-d", str(duration),
-                "-r", str(sample_rate), "-c", str(channels), output_path
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration + 10)
-            
-            if result.returncode == 0 and os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                return {
-                    "success": True,
-                    "result": {
-                        "file_path": output_path,
-                        "duration": duration,
-                        "sample_rate": sample_rate,
-                        "channels": channels,
-                        "file_size": file_size,
-                        "method": "audio_record"
-                    },
-                    "error": None
-                }
-            else:
-                return {"success": False, "result": None, "error": f"Recording failed: {result.stderr}"}
-        
-        elif system == "Darwin":  # macOS
-            # Use sox or afrecord
-            cmd = ["sox", "-t", "coreaudio", "default", "-r", str(sample_rate), "-c", str(channels), output_path, "trim", "0", str(duration)]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=duration + 10)
-            
-            if result.returncode == 0 and os.path.exists(output_path):
-                file_size = os.path.getsize(output_path)
-                return {
-                    "success": True,
-                    "result": {
-                        "file_path": output_path,
-                        "duration": duration,
-                        "sample_rate": sample_rate,
-                        "channels": channels,
-                        "file_size": file_size,
-                        "method": "audio_record"
-                    },
-                    "error": None
-                }
-            else:
-                return {"success": False, "result": None, "error": f"Recording failed: {result.stderr}"}
+        settings = _record_settings(args)
+        _, output_path, sample_rate, channels = settings
         
-        elif system == "Windows":
-            return {"success": False, "result": None, "error": "Windows audio recording requires additional setup (install SoX or use PowerShell)"}
+        modules = _sound_modules()
+        if modules is not None:
+            # Capture straight into a NumPy buffer instead of spawning a recorder.
+            # A stream of our own, unlike sd.rec, isn't stopped by other calls' playback
+            sd, sf = modules
+            with sd.InputStream(samplerate=sample_rate, channels=channels, dtype="int16",
+                                device=args.get("device")) as stream:
+                data, _ = stream.read(int(duration * sample_rate))
+            sf.write(output_path, data, sample_rate)
+            return _ok({
+                "file_path": output_path,
+                "duration": duration,
+                "sample_rate": sample_rate,
+                "channels": channels,
+                "file_size": os.path.getsize(output_path)
+            }, "audio_record")
         
+        cmd = _record_command(*settings)
+        if cmd is not None:
+            return _recorded(_run(cmd, timeout=duration + 10), *settings)
+        elif _SYSTEM == "Windows":
+            return _err("Windows audio recording requires additional setup (install SoX or use PowerShell)")
         else:
-            return {"success": False, "result": None, "error": f"Unsupported platform: {system}"}
+            return _err(f"Unsupported platform: {_SYSTEM}")
     
     except subprocess.TimeoutExpired:
-        return {"success": False, "result": None, "error": f"Recording timed out after {duration} seconds"}
+        return _err(f"Recording timed out after {duration} seconds")
     except Exception as e:
-        return {"success": False, "result": None, "error": f"Failed to record audio: {str(e)}"}
+        return _err(f"Failed to record audio: {str(e)}")
+
+def _record_settings(args: Dict[str, Any]) -> Tuple[Any, str, int, int]:
+    """(duration, output_path, sample_rate, channels) of a record call"""
+    duration = args["duration"]
+    output_path = args.get("output_path")
+    if not output_path:
+        output_path = os.path.join(tempfile.gettempdir(), f"recording_{duration}s.wav")
+    return duration, output_path, args.get("sample_rate", 44100), args.get("channels", 1)
+
+def _record_command(duration: Any, output_path: str, sample_rate: int, channels: int) -> Optional[List[str]]:
+    """Recorder command line for this platform, or None where there is none"""
+    if _SYSTEM == "Linux":
+        # Use arecord (ALSA)
+        return [
+            "arecord", "-f", "cd", "-t", "wav", "-d", str(duration),
+            "-r", str(sample_rate), "-c", str(channels), output_path
+        ]
+    if _SYSTEM == "Darwin":  # macOS
+        # Use sox or afrecord
+        return ["sox", "-t", "coreaudio", "default", "-r", str(sample_rate), "-c", str(channels), output_path, "trim", "0", str(duration)]
+    return None
+
+def _recorded(result: subprocess.CompletedProcess, duration: Any, output_path: str,
+              sample_rate: int, channels: int) -> Dict[str, Any]:
+    """Tool response for a finished recorder process"""
+    if result.returncode == 0 and os.path.exists(output_path):
+        file_size = os.path.getsize(output_path)
+        return _ok({
+            "file_path": output_path,
+            "duration": duration,
+            "sample_rate": sample_rate,
+            "channels": channels,
+            "file_size": file_size
+        }, "audio_record")
+    else:
+        return _err(f"Recording failed: {_stderr_text(result)}")
 
 def _play_audio_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Play audio implementation"""
     file_path = args.get("file")
     if not file_path:
-        return {"success": False, "result": None, "error": "Missing required argument: file"}
+        return _err("Missing required argument: file")
     
     try:
         if not os.path.exists(file_path):
-            return {"success": False, "result": None, "error": f"Audio file not found: {file_path}"}
+            return _err(f"Audio file not found: {file_path}")
         
-        system = platform.system()
+        modules = _sound_modules()
+        if modules is not None:
+            sd, sf = modules
+            try:
+                data, sample_rate = sf.read(file_path, dtype="float32", always_2d=True)
+            except RuntimeError:
+                # Format libsndfile can't decode (e.g. mp3 on older builds); use a player below
+                pass
+            else:
+                # One output stream per call: sd.play/sd.wait share a module-level
+                # stream, so concurrent calls would cut each other off
+                with sd.OutputStream(samplerate=sample_rate, channels=data.shape[1], dtype="float32",
+                                     device=args.get("device")) as stream:
+                    stream.write(data)
+                return _ok({"file_path": file_path, "player": "sounddevice", "played": True}, "audio_play")
         
-        if system == "Linux":
-            # Try multiple players
-            players = ["aplay", "paplay", "play", "mpg123", "ffplay"]
-            for player in players:
-                try:
-                    if player == "ffplay":
-                        cmd = [player, "-nodisp", "-autoexit", file_path]
-                    else:
-                        cmd = [player, file_path]
-                    
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-                    if result.returncode == 0:
-                        return {
-                            "success": True,
-                            "result": {
-                                "file_path": file_path,
-                                "player": player,
-                                "played": True,
-                                "method": "audio_play"
-                            },
-                            "error": None
-                        }
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    continue
-            
-            return {"success": False, "result": None, "error": "No suitable audio player found (install aplay, paplay, or ffmpeg)"}
+        cmd = _play_command(file_path)
+        if cmd is not None:
+            return _played(_run(cmd, timeout=30), file_path)
         
-        elif system == "Darwin":  # macOS
-            cmd = ["afplay", file_path]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "result": {
-                        "file_path": file_path,
-                        "player": "afplay",
-                        "played": True,
-                        "method": "audio_play"
-                    },
-                    "error": None
-                }
-            else:
-                return {"success": False, "result": None, "error": f"Playback failed: {result.stderr}"}
+        if _SYSTEM == "Linux":
+            return _err("No suitable audio player found (install aplay, paplay, or ffmpeg)")
         
-        elif system == "Windows":
-            # Use Windows Media Player or PowerShell
-            cmd = ["powershell", "-c", f"(New-Object Media.SoundPlayer '{file_path}').PlaySync()"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-            
-            if result.returncode == 0:
-                return {
-                    "success": True,
-                    "result": {
-                        "file_path": file_path,
-                        "player": "powershell",
-                        "played": True,
-                        "method": "audio_play"
-                    },
-                    "error": None
-                }
-            else:
-                return {"success": False, "result": None, "error": f"Playback failed: {result.stderr}"}
+        elif _SYSTEM == "Windows":
+            # Play in-process through the stdlib instead of starting PowerShell;
+            # like Media.SoundPlayer, PlaySound handles WAV files only
+            import winsound
+            try:
+                winsound.PlaySound(file_path, winsound.SND_FILENAME | winsound.SND_NODEFAULT)
+            except RuntimeError as e:
+                return _err(f"Playback failed: {str(e)}")
+            return _ok({"file_path": file_path, "player": "winsound", "played": True}, "audio_play")
         
         else:
-            return {"success": False, "result": None, "error": f"Unsupported platform: {system}"}
+            return _err(f"Unsupported platform: {_SYSTEM}")
     
     except subprocess.TimeoutExpired:
-        return {"success": False, "result": None, "error": "Audio playback timed out"}
+        return _err("Audio playback timed out")
     except Exception as e:
-        return {"success": False, "result": None, "error": f"Failed to play audio: {str(e)}"}
+        return _err(f"Failed to play audio: {str(e)}")
+
+def _play_command(file_path: str) -> Optional[List[str]]:
+    """Player command line for this platform, or None where none is available"""
+    if _SYSTEM == "Linux":
+        # Use the first installed player rather than trying each in turn
+        player = _first_available(("aplay", "paplay", "play", "mpg123", "ffplay"))
+        if player is None:
+            return None
+        if player == "ffplay":
+            # Skip ffplay's input probing/buffering so sound starts in ~100 ms
+            # rather than >1 s; the first few ms of some streams may be clipped
+            return [player, "-nodisp", "-autoexit", "-fflags", "nobuffer", "-flags", "low_delay",
+                    "-probesize", "32", "-analyzeduration", "0", file_path]
+        return [player, file_path]
+    if _SYSTEM == "Darwin":  # macOS
+        return ["afplay", file_path]
+    return None
+
+def _played(result: subprocess.CompletedProcess, file_path: str) -> Dict[str, Any]:
+    """Tool response for a finished player process"""
+    if result.returncode == 0:
+        return _ok({"file_path": file_path, "player": result.args[0], "played": True}, "audio_play")
+    else:
+        return _err(f"Playback failed: {_stderr_text(result)}")
 
 def _speak_text_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Text-to-speech implementation"""
     text = args.get("text")
     if not text:
-        return {"success": False, "result": None, "error": "Missing required argument: text"}
+        return _err("Missing required argument: text")
     
     try:
         voice = args.get("voice", "default")
         rate = args.get("rate", 200)  # Words per minute
-        system = platform.system()
-        
-        if system == "Linux":
-            # Use espeak or festival
-            tts_engines = [
-                ["espeak", "-s", str(rate), text],
-                ["festival", "--tts"],
-                ["spd-say", text]
-            ]
+        
+        with _tts_lock:
+            tts = _tts_engine()
+            if tts is not None:
+                engine, default_voice = tts
+                engine.setProperty("rate", rate)
+                engine.setProperty("voice", default_voice if voice == "default" else voice)
+                engine.say(text)
+                engine.runAndWait()
+                return _ok({
+                    "text": text,
+                    "engine": "pyttsx3",
+                    "voice": voice,
+                    "rate": rate,
+                    "spoken": True
+                }, "text_to_speech")
+        
+        if _SYSTEM == "Linux":
+            # Use espeak, festival or speech-dispatcher, whichever is installed first
+            engine = _first_available(("espeak", "festival", "spd-say"))
+            if engine is None:
+                return _err("No TTS engine found (install espeak, festival, or speech-dispatcher)")
             
-            for cmd in tts_engines:
-                try:
-                    if cmd[0] == "festival":
-                        result = subprocess.run(cmd, input=text, text=True, capture_output=True, timeout=10)
-                    else:
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-                    
-                    if result.returncode == 0:
-                        return {
-                            "success": True,
-                            "result": {
-                                "text": text,
-                                "engine": cmd[0],
-                                "voice": voice,
-                                "rate": rate,
-                                "spoken": True,
-                                "method": "text_to_speech"
-                            },
-                            "error": None
-                        }
-                except (subprocess.TimeoutExpired, FileNotFoundError):
-                    continue
+            if engine == "festival":
+                result = _run([engine, "--tts"], input=text.encode(), timeout=10)
+            elif engine == "espeak":
+                result = _run([engine, "-s", str(rate), text], timeout=10)
+            else:
+                result = _run([engine, text], timeout=10)
             
-            return {"success": False, "result": None, "error": "No TTS engine found (install espeak, festival, or speech-dispatcher)"}
+            if result.returncode == 0:
+                return _ok({
+                    "text": text,
+                    "engine": engine,
+                    "voice": voice,
+                    "rate": rate,
+                    "spoken": True
+                }, "text_to_speech")
+            else:
+                return _err(f"TTS failed: {_stderr_text(result)}")
         
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             cmd = ["say", "-r", str(rate), text]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+            result = _run(cmd, timeout=10)
             
             if result.returncode == 0:
-                return {
-                    "success": True,
-                    "result": {
-                        "text": text,
-                        "engine": "say",
-                        "voice": voice,
-                        "rate": rate,
-                        "spoken": True,
-                        "method": "text_to_speech"
-                    },
-                    "error": None
-                }
+                return _ok({
+                    "text": text,
+                    "engine": "say",
+                    "voice": voice,
+                    "rate": rate,
+                    "spoken": True
+                }, "text_to_speech")
             else:
-                return {"success": False, "result": None, "error": f"TTS failed: {result.stderr}"}
+                return _err(f"TTS failed: {_stderr_text(result)}")
         
-        elif system == "Windows":
-            # Use PowerShell with SAPI
-            ps_script = f"""
-            Add-Type -AssemblyName System.Speech
-            $synth = New-Object System.Speech.Synthesis.SpeechSynthesizer
-            $synth.Rate = {rate // 20}  # Convert to SAPI rate (-10 to 10)
-            $synth.Speak('{text}')
-            """
-            cmd = ["powershell", "-c", ps_script]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        elif _SYSTEM == "Windows":
+            # Use PowerShell with SAPI; the script is fixed and the text arrives on stdin
+            cmd = [
+                "powershell", "-NoProfile", "-NonInteractive", "-ExecutionPolicy", "Bypass",
+                "-File", _sapi_speak_script(), "-Rate", str(rate // 20)  # Convert to SAPI rate (-10 to 10)
+            ]
+            result = _run(cmd, input=text.encode("utf-8"), timeout=10)
             
             if result.returncode == 0:
-                return {
-                    "success": True,
-                    "result": {
-                        "text": text,
-                        "engine": "sapi",
-                        "voice": voice,
-                        "rate": rate,
-                        "spoken": True,
-                        "method": "text_to_speech"
-                    },
-                    "error": None
-                }
+                return _ok({
+                    "text": text,
+                    "engine": "sapi",
+                    "voice": voice,
+                    "rate": rate,
+                    "spoken": True
+                }, "text_to_speech")
             else:
-                return {"success": False, "result": None, "error": f"TTS failed: {result.stderr}"}
+                return _err(f"TTS failed: {_stderr_text(result)}")
         
         else:
-            return {"success": False, "result": None, "error": f"Unsupported platform: {system}"}
+            return _err(f"Unsupported platform: {_SYSTEM}")
     
     except subprocess.TimeoutExpired:
-        return {"success": False, "result": None, "error": "Text-to-speech timed out"}
+        return _err("Text-to-speech timed out")
     except Exception as e:
-        return {"success": False, "result": None, "error": f"Failed to speak text: {str(e)}"}
+        return _err(f"Failed to speak text: {str(e)}")
+
+@lru_cache(maxsize=4)
+def _get_whisper(model_name: str, device: str, compute_type: Optional[str] = None):
+    """Load a Whisper model once per (model, device, compute type) and keep it resident
+    
+    Without an explicit compute_type the weights are quantized: int8 with
+    FP16 activations on GPU, plain int8 on CPU.
+    """
+    from faster_whisper import WhisperModel
+    if compute_type is None:
+        if device == "auto":
+            import ctranslate2
+            on_gpu = ctranslate2.get_cuda_device_count() > 0
+        else:
+            on_gpu = device == "cuda"
+        compute_type = "int8_float16" if on_gpu else "int8"
+    return WhisperModel(model_name, device=device, compute_type=compute_type)
 
 def _transcribe_audio_impl(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Audio transcription implementation"""
-    file_path = args.get("file")
-    if not file_path:
-        return {"success": False, "result": None, "error": "Missing required argument: file"}
+    """Audio transcription implementation
+    
+    file may be one path or a list of paths. All of them share one loaded
+    model, and each goes through faster-whisper's batched pipeline, which
+    runs the file's speech chunks through the model batch_size at a time.
+    """
+    files = args.get("file")
+    if not files:
+        return _err("Missing required argument: file")
+    
+    single = isinstance(files, str)
+    if single:
+        files = [files]
     
     try:
-        if not os.path.exists(file_path):
-            return {"success": False, "result": None, "error": f"Audio file not found: {file_path}"}
+        for file_path in files:
+            if not os.path.exists(file_path):
+                return _err(f"Audio file not found: {file_path}")
+        
+        from faster_whisper import BatchedInferencePipeline
+        
+        model = _get_whisper(
+            args.get("model", "small"),
+            args.get("device", "auto"),
+            args.get("compute_type")
+        )
+        pipeline = BatchedInferencePipeline(model=model)
+        batch_size = args.get("batch_size", 16)
+        language = args.get("language")
         
-        # This would require speech recognition libraries like whisper, vosk, or cloud APIs
-        # For now, return a placeholder implementation
-        return {
-            "success": False,
-            "result": None,
-            "error": "Audio transcription requires additional setup (install whisper, vosk, or configure cloud API)"
-        }
+        transcriptions = []
+        for file_path in files:
+            segments, info = pipeline.transcribe(file_path, batch_size=batch_size, language=language)
+            segments = [
+                {"start": segment.start, "end": segment.end, "text": segment.text.strip()}
+                for segment in segments
+            ]
+            transcriptions.append({
+                "file": file_path,
+                "text": " ".join(segment["text"] for segment in segments),
+                "language": info.language,
+                "duration": info.duration,
+                "segments": segments
+            })
+        
+        if single:
+            return _ok(transcriptions[0], "audio_transcribe")
+        return _ok({"transcriptions": transcriptions, "count": len(transcriptions)}, "audio_transcribe")
     
+    except ImportError:
+        return _err("Audio transcription requires faster-whisper (pip install faster-whisper)")
     except Exception as e:
-        return {"success": False, "result": None, "error": f"Failed to transcribe audio: {str(e)}"}
+        return _err(f"Failed to transcribe audio: {str(e)}")
 
-def _list_audio_devices_impl(args: Dict[str, Any]) -> Dict[str, Any]:
-    """List audio devices implementation"""
+def _transcribe_stream_impl(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Streaming transcription implementation
+    
+    chunk holds up to one second of 16 kHz mono float samples. Chunks from
+    concurrent calls are batched by a background worker into one model pass,
+    and each call gets back the text for its own chunk.
+    """
+    chunk = args.get("chunk")
+    if chunk is None:
+        return _err("Missing required argument: chunk")
+    
     try:
-        system = platform.system()
-        devices = []
+        import numpy as np
         
-        if system == "Linux":
-            # Use arecord and aplay to list devices
-            try:
-                # List capture devices
-                result = subprocess.run(["arecord", "-l"], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if 'card' in line and 'device' in line:
-                            devices.append({"type": "input", "name": line.strip(), "driver": "alsa"})
-                
-                # List playback devices
-                result = subprocess.run(["aplay", "-l"], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if 'card' in line and 'device' in line:
-                            devices.append({"type": "output", "name": line.strip(), "driver": "alsa"})
-            except:
-                pass
+        samples = np.asarray(chunk, dtype=np.float32).ravel()
+        if samples.size > _STREAM_CHUNK_SAMPLES:
+            return _err(f"Chunk too long: {samples.size} samples (max {_STREAM_CHUNK_SAMPLES})")
         
-        elif system == "Darwin":  # macOS
-            # Use system_profiler
-            try:
-                result = subprocess.run(["system_profiler", "SPAudioDataType"], capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    # Parse macOS audio device info
-                    devices.append({"type": "input", "name": "Built-in Microphone", "driver": "coreaudio"})
-                    devices.append({"type": "output", "name": "Built-in Speakers", "driver": "coreaudio"})
-            except:
-                pass
+        model = _get_whisper(
+            args.get("model", "small"),
+            args.get("device", "auto"),
+            args.get("compute_type")
+        )
+        call_id = args.get("call_id")
+        language = args.get("language")
         
-        elif system == "Windows":
-            # Use PowerShell to list audio devices
-            try:
-                ps_script = "Get-WmiObject -Class Win32_SoundDevice | Select-Object Name, Status"
-                result = subprocess.run(["powershell", "-c", ps_script], capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if line.strip() and 'Name' not in line and '---' not in line:
-                            devices.append({"type": "unknown", "name": line.strip(), "driver": "windows"})
-            except:
-                pass
+        _ensure_stream_worker()
+        future: Future = Future()
+        _stream_queue.put((model, language, call_id, samples, future))
+        try:
+            text = future.result(timeout=args.get("timeout", 30))
+        except FutureTimeoutError:
+            # Cancelled so the batcher drops the chunk if it hasn't started on it
+            future.cancel()
+            return _err("Timed out waiting for stream transcription")
+        
+        return _ok({"call_id": call_id, "text": text, "samples": int(samples.size)}, "stream_transcribe")
+    
+    except ImportError:
+        return _err("Audio transcription requires faster-whisper (pip install faster-whisper)")
+    except Exception as e:
+        return _err(f"Failed to transcribe stream chunk: {str(e)}")
+
+def _ensure_stream_worker() -> None:
+    """Start the streaming batcher thread on first use"""
+    global _stream_worker
+    with _stream_lock:
+        if _stream_worker is None or not _stream_worker.is_alive():
+            _stream_worker = threading.Thread(target=_stream_batcher, name="que-transcribe-stream", daemon=True)
+            _stream_worker.start()
+
+def _stream_batcher() -> None:
+    """Collect queued chunks for up to _STREAM_WINDOW and transcribe them in batches"""
+    while True:
+        pending = [_stream_queue.get()]
+        try:
+            deadline = time.monotonic() + _STREAM_WINDOW
+            while len(pending) < _STREAM_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    pending.append(_stream_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            _transcribe_pending(pending)
+        except Exception as e:
+            # Never let one bad window kill the worker; fail its callers instead
+            for item in pending:
+                if not item[4].done():
+                    item[4].set_exception(e)
+
+def _transcribe_pending(pending: List[Tuple[Any, str, Optional[str], Any, Future]]) -> None:
+    """Transcribe one window of queued chunks, resolving each caller's future"""
+    # Callers that timed out have cancelled their futures; skip their chunks
+    pending = [item for item in pending if item[4].set_running_or_notify_cancel()]
+    
+    # One forward pass per (model, language) sharing the window
+    groups: Dict[Tuple[int, Optional[str]], List[Tuple[Any, str, Optional[str], Any, Future]]] = {}
+    for item in pending:
+        groups.setdefault((id(item[0]), item[1]), []).append(item)
+    for items in groups.values():
+        try:
+            texts = _transcribe_chunk_batch(items[0][0], items[0][1], [item[3] for item in items])
+        except Exception as e:
+            for item in items:
+                item[4].set_exception(e)
+        else:
+            for item, text in zip(items, texts):
+                item[4].set_result(text)
+
+def _transcribe_chunk_batch(model: Any, language: Optional[str], chunks: List[Any]) -> List[str]:
+    """Decode a list of chunks in batched model passes
+    
+    The chunks are laid end to end in one-second slots and handed to
+    BatchedInferencePipeline with one clip per slot, so each is decoded
+    independently; segments are mapped back to their chunk by start time.
+    clip_timestamps are given in seconds, which needs faster-whisper 1.2+
+    (1.1 read them as sample indices).
+    """
+    import numpy as np
+    from faster_whisper import BatchedInferencePipeline
+    
+    audio = np.zeros(len(chunks) * _STREAM_CHUNK_SAMPLES, dtype=np.float32)
+    for slot, chunk in enumerate(chunks):
+        start = slot * _STREAM_CHUNK_SAMPLES
+        audio[start:start + chunk.size] = chunk
+    clip_seconds = _STREAM_CHUNK_SAMPLES / _STREAM_SAMPLE_RATE
+    clips = [{"start": slot * clip_seconds, "end": (slot + 1) * clip_seconds} for slot in range(len(chunks))]
+    
+    segments, _ = BatchedInferencePipeline(model=model).transcribe(
+        audio, language=language, beam_size=1, clip_timestamps=clips, batch_size=len(chunks)
+    )
+    texts: List[List[str]] = [[] for _ in chunks]
+    for segment in segments:
+        slot = min(int(segment.start // clip_seconds), len(chunks) - 1)
+        texts[slot].append(segment.text.strip())
+    return [" ".join(parts) for parts in texts]
+
+def _list_audio_devices_impl(args: Dict[str, Any]) -> Dict[str, Any]:
+    """List audio devices implementation
+    
+    The listing is cached for _DEVICES_CACHE_TTL seconds; pass refresh=True to re-probe.
+    """
+    global _devices_cache
+    try:
+        cached_at, cached = _devices_cache
+        if cached is not None and not args.get("refresh") and time.monotonic() - cached_at < _DEVICES_CACHE_TTL:
+            devices = cached
+        else:
+            devices = _probe_audio_devices()
+            _devices_cache = (time.monotonic(), devices)
         
-        return {
-            "success": True,
-            "result": {
-                "devices": devices,
-                "count": len(devices),
-                "platform": system,
-                "method": "audio_device_list"
-            },
-            "error": None
-        }
+        return _ok({
+            "devices": [dict(device) for device in devices],
+            "count": len(devices),
+            "platform": _SYSTEM
+        }, "audio_device_list")
     
     except Exception as e:
-        return {"success": False, "result": None, "error": f"Failed to list audio devices: {str(e)}"}
+        return _err(f"Failed to list audio devices: {str(e)}")
+
+def _probe_audio_devices() -> List[Dict[str, str]]:
+    """Query the platform's audio tools for input/output devices"""
+    devices = []
+    
+    if _SYSTEM == "Linux":
+        # Use arecord and aplay to list devices
+        capture, playback = _run_concurrently([["arecord", "-l"], ["aplay", "-l"]], timeout=5)
+        for device_type, stdout in (("input", capture), ("output", playback)):
+            if stdout:
+                for match in _ALSA_DEVICE_RE.finditer(stdout):
+                    devices.append({"type": device_type, "name": match.group().strip(), "driver": "alsa"})
+    
+    elif _SYSTEM == "Darwin":  # macOS
+        # Use system_profiler, plus SwitchAudioSource's device names when installed
+        cmds = [["system_profiler", "SPAudioDataType"]]
+        switcher = _first_available(("SwitchAudioSource",))
+        if switcher:
+            cmds += [[switcher, "-a", "-t", "input"], [switcher, "-a", "-t", "output"]]
+        profile, *named = _run_concurrently(cmds, timeout=10)
+        
+        if any(named):
+            for device_type, stdout in zip(("input", "output"), named):
+                for name in (stdout or "").splitlines():
+                    if name.strip():
+                        devices.append({"type": device_type, "name": name.strip(), "driver": "coreaudio"})
+        elif profile is not None:
+            # Parse macOS audio device info
+            devices.append({"type": "input", "name": "Built-in Microphone", "driver": "coreaudio"})
+            devices.append({"type": "output", "name": "Built-in Speakers", "driver": "coreaudio"})
+    
+    elif _SYSTEM == "Windows":
+        # Use PowerShell to list audio devices
+        ps_script = "Get-WmiObject -Class Win32_SoundDevice | Select-Object Name, Status"
+        (stdout,) = _run_concurrently([["powershell", "-NoProfile", "-c", ps_script]], timeout=10)
+        for line in (stdout or "").split('\n'):
+            if line.strip() and 'Name' not in line and '---' not in line:
+                devices.append({"type": "unknown", "name": line.strip(), "driver": "windows"})
+    
+    return devices
 
 def _set_volume_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Set system volume implementation"""
     volume = args.get("volume")
     if volume is None:
-        return {"success": False, "result": None, "error": "Missing required argument: volume (0-100)"}
+        return _err("Missing required argument: volume (0-100)")
     
     try:
         if not 0 <= volume <= 100:
-            return {"success": False, "result": None, "error": "Volume must be between 0 and 100"}
-        
-        system = platform.system()
+            return _err("Volume must be between 0 and 100")
         
-        if system == "Linux":
+        if _SYSTEM == "Linux":
+            pulsectl = _pulsectl_module()
+            if pulsectl is not None:
+                try:
+                    with pulsectl.Pulse("que-tools") as pulse:
+                        sink = pulse.get_sink_by_name(pulse.server_info().default_sink_name)
+                        pulse.volume_set_all_chans(sink, volume / 100.0)
+                    return _ok({"volume": volume, "set": True}, "volume_control")
+                except pulsectl.PulseError:
+                    pass  # No PulseAudio server reachable; fall back to amixer
+            
             # Use amixer
             cmd = ["amixer", "sset", "Master", f"{volume}%"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            result = _run(cmd, timeout=5)
             
             if result.returncode == 0:
-                return {
-                    "success": True,
-                    "result": {
-                        "volume": volume,
-                        "set": True,
-                        "method": "volume_control"
-                    },
-                    "error": None
-                }
+                return _ok({"volume": volume, "set": True}, "volume_control")
             else:
-                return {"success": False, "result": None, "error": f"Volume control failed: {result.stderr}"}
+                return _err(f"Volume control failed: {_stderr_text(result)}")
         
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             # Use osascript
             cmd = ["osascript", "-e", f"set volume output volume {volume}"]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            result = _run(cmd, timeout=5)
             
             if result.returncode == 0:
-                return {
-                    "success": True,
-                    "result": {
-                        "volume": volume,
-                        "set": True,
-                        "method": "volume_control"
-                    },
-                    "error": None
-                }
+                return _ok({"volume": volume, "set": True}, "volume_control")
             else:
-                return {"success": False, "result": None, "error": f"Volume control failed: {result.stderr}"}
+                return _err(f"Volume control failed: {_stderr_text(result)}")
         
-        elif system == "Windows":
+        elif _SYSTEM == "Windows":
             # Use PowerShell with Windows Audio API
             ps_script = f"""
             Add-Type -TypeDefinition @'
@@ -494,131 +836,234 @@ def _set_volume_impl(args: Dict[str, Any]) -> Dict[str, Any]:
 '@
             # This is a simplified approach - full implementation would use Windows Audio Session API
             """
-            return {"success": False, "result": None, "error": "Windows volume control requires additional setup"}
+            return _err("Windows volume control requires additional setup")
         
         else:
-            return {"success": False, "result": None, "error": f"Unsupported platform: {system}"}
+            return _err(f"Unsupported platform: {_SYSTEM}")
     
     except Exception as e:
-        return {"success": False, "result": None, "error": f"Failed to set volume: {str(e)}"}
+        return _err(f"Failed to set volume: {str(e)}")
 
 def _get_volume_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Get system volume implementation"""
     try:
-        system = platform.system()
         
-        if system == "Linux":
+        if _SYSTEM == "Linux":
+            pulsectl = _pulsectl_module()
+            if pulsectl is not None:
+                try:
+                    with pulsectl.Pulse("que-tools") as pulse:
+                        sink = pulse.get_sink_by_name(pulse.server_info().default_sink_name)
+                    return _ok({"volume": round(sink.volume.value_flat * 100), "muted": bool(sink.mute)}, "volume_get")
+                except pulsectl.PulseError:
+                    pass  # No PulseAudio server reachable; fall back to amixer
+            
             # Use amixer
             cmd = ["amixer", "sget", "Master"]
+            if not _has(cmd[0]):
+                return _err("Volume query failed: amixer: command not found")
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
             
             if result.returncode == 0:
                 # Parse amixer output to extract volume percentage
-                import re
-                match = re.search(r'\[(\d+)%\]', result.stdout)
+                match = _AMIXER_VOLUME_RE.search(result.stdout)
                 if match:
                     volume = int(match.group(1))
-                    return {
-                        "success": True,
-                        "result": {
-                            "volume": volume,
-                            "muted": "[off]" in result.stdout,
-                            "method": "volume_get"
-                        },
-                        "error": None
-                    }
+                    return _ok({"volume": volume, "muted": "[off]" in result.stdout}, "volume_get")
                 else:
-                    return {"success": False, "result": None, "error": "Could not parse volume from amixer output"}
+                    return _err("Could not parse volume from amixer output")
             else:
-                return {"success": False, "result": None, "error": f"Volume query failed: {result.stderr}"}
+                return _err(f"Volume query failed: {result.stderr}")
         
-        elif system == "Darwin":  # macOS
+        elif _SYSTEM == "Darwin":  # macOS
             # Use osascript
             cmd = ["osascript", "-e", "output volume of (get volume settings)"]
+            if not _has(cmd[0]):
+                return _err("Volume query failed: osascript: command not found")
             result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
             
             if result.returncode == 0:
                 try:
                     volume = int(result.stdout.strip())
-                    return {
-                        "success": True,
-                        "result": {
-                            "volume": volume,
-                            "muted": False,  # Would need additional check
-                            "method": "volume_get"
-                        },
-                        "error": None
-                    }
+                    return _ok({
+                        "volume": volume,
+                        "muted": False  # Would need additional check
+                    }, "volume_get")
                 except ValueError:
-                    return {"success": False, "result": None, "error": "Could not parse volume from osascript output"}
+                    return _err("Could not parse volume from osascript output")
             else:
-                return {"success": False, "result": None, "error": f"Volume query failed: {result.stderr}"}
+                return _err(f"Volume query failed: {result.stderr}")
         
-        elif system == "Windows":
-            return {"success": False, "result": None, "error": "Windows volume query requires additional setup"}
+        elif _SYSTEM == "Windows":
+            return _err("Windows volume query requires additional setup")
         
         else:
-            return {"success": False, "result": None, "error": f"Unsupported platform: {system}"}
+            return _err(f"Unsupported platform: {_SYSTEM}")
     
     except Exception as e:
-        return {"success": False, "result": None, "error": f"Failed to get volume: {str(e)}"}
+        return _err(f"Failed to get volume: {str(e)}")
 
 # Media Processing Implementation Helpers
 def _transcribe_media_impl(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Media transcription implementation"""
-    return {"success": False, "result": None, "error": "Media transcription requires AI/ML libraries (whisper, vosk, etc.)"}
+    """Media transcription implementation
+    
+    faster-whisper decodes audio tracks from video containers itself (via PyAV),
+    so media files go through the same path as audio files.
+    """
+    return _transcribe_audio_impl(args)
 
 def _analyze_scene_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Scene analysis implementation"""
-    return {"success": False, "result": None, "error": "Scene analysis requires computer vision libraries (opencv, tensorflow, etc.)"}
+    return _err("Scene analysis requires computer vision libraries (opencv, tensorflow, etc.)")
 
 def _detect_faces_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Face detection implementation"""
-    return {"success": False, "result": None, "error": "Face detection requires computer vision libraries (opencv, dlib, etc.)"}
+    return _err("Face detection requires computer vision libraries (opencv, dlib, etc.)")
 
 def _detect_objects_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Object detection implementation"""
-    return {"success": False, "result": None, "error": "Object detection requires AI/ML libraries (yolo, tensorflow, etc.)"}
+    return _err("Object detection requires AI/ML libraries (yolo, tensorflow, etc.)")
 
 def _extract_audio_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Audio extraction from video implementation"""
     file_path = args.get("file")
     if not file_path:
-        return {"success": False, "result": None, "error": "Missing required argument: file"}
+        return _err("Missing required argument: file")
     
     try:
         if not os.path.exists(file_path):
-            return {"success": False, "result": None, "error": f"Media file not found: {file_path}"}
-        
-        output_path = args.get("output_path")
-        if not output_path:
-            base_name = os.path.splitext(os.path.basename(file_path))[0]
-            output_path = os.path.join(tempfile.gettempdir(), f"{base_name}_audio.wav")
-        
-        # Use ffmpeg to extract audio
-        cmd = ["ffmpeg", "-i", file_path, "-vn", "-acodec", "pcm_s16le", "-ar", "44100", "-ac", "2", output_path, "-y"]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-        
-        if result.returncode == 0 and os.path.exists(output_path):
-            file_size = os.path.getsize(output_path)
-            return {
-                "success": True,
-                "result": {
-                    "input_file": file_path,
-                    "output_file": output_path,
-                    "file_size": file_size,
-                    "extracted": True,
-                    "method": "audio_extract"
-                },
-                "error": None
-            }
-        else:
-            return {"success": False, "result": None, "error": f"Audio extraction failed: {result.stderr}"}
+            return _err(f"Media file not found: {file_path}")
+        
+        return _extracted(_run(_extract_command(args), timeout=60), args)
+    
+    except subprocess.TimeoutExpired:
+        return _err("Audio extraction timed out")
+    except Exception as e:
+        return _err(f"Failed to extract audio: {str(e)}")
+
+def _extract_settings(args: Dict[str, Any]) -> Tuple[str, str, int, int]:
+    """(file_path, output_path, sample_rate, channels) of an extract_audio call"""
+    file_path = args["file"]
+    output_path = args.get("output_path")
+    if not output_path:
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        output_path = os.path.join(tempfile.gettempdir(), f"{base_name}_audio.wav")
+    
+    # Default to 16 kHz mono, the format Whisper consumes, so ASR needn't resample
+    return file_path, output_path, args.get("sample_rate", 16000), args.get("channels", 1)
+
+def _extract_command(args: Dict[str, Any]) -> List[str]:
+    """ffmpeg command line for an extract_audio call"""
+    file_path, output_path, sample_rate, channels = _extract_settings(args)
+    # Only errors reach stderr, and decoding and resampling may use every core
+    return [
+        "ffmpeg", "-hide_banner", "-loglevel", "error", "-threads", "0",
+        "-i", file_path, "-vn", "-acodec", "pcm_s16le",
+        "-ar", str(sample_rate), "-ac", str(channels), "-y", output_path
+    ]
+
+def _extracted(result: subprocess.CompletedProcess, args: Dict[str, Any]) -> Dict[str, Any]:
+    """Tool response for a finished ffmpeg extraction"""
+    file_path, output_path, sample_rate, channels = _extract_settings(args)
+    if result.returncode == 0 and os.path.exists(output_path):
+        file_size = os.path.getsize(output_path)
+        return _ok({
+            "input_file": file_path,
+            "output_file": output_path,
+            "file_size": file_size,
+            "sample_rate": sample_rate,
+            "channels": channels,
+            "extracted": True
+        }, "audio_extract")
+    else:
+        return _err(f"Audio extraction failed: {_stderr_text(result)}")
+
+# Async variants of the subprocess-bound actions. Cases they don't run as a
+# child process (in-process audio libraries, Windows, argument errors) are
+# handed to the sync implementation in a worker thread.
+async def _record_audio_impl_async(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Record audio implementation, awaiting the recorder process"""
+    duration = args.get("duration")
+    if not duration or _sound_modules() is not None:
+        return await asyncio.to_thread(_record_audio_impl, args)
+    
+    try:
+        settings = _record_settings(args)
+        cmd = _record_command(*settings)
+        if cmd is None:
+            return await asyncio.to_thread(_record_audio_impl, args)
+        return _recorded(await _run_async(cmd, timeout=duration + 10), *settings)
     
     except subprocess.TimeoutExpired:
-        return {"success": False, "result": None, "error": "Audio extraction timed out"}
+        return _err(f"Recording timed out after {duration} seconds")
     except Exception as e:
-        return {"success": False, "result": None, "error": f"Failed to extract audio: {str(e)}"}
+        return _err(f"Failed to record audio: {str(e)}")
+
+async def _play_audio_impl_async(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Play audio implementation, awaiting the player process"""
+    file_path = args.get("file")
+    if not file_path or _sound_modules() is not None:
+        return await asyncio.to_thread(_play_audio_impl, args)
+    
+    try:
+        if not os.path.exists(file_path):
+            return _err(f"Audio file not found: {file_path}")
+        
+        cmd = _play_command(file_path)
+        if cmd is None:
+            return await asyncio.to_thread(_play_audio_impl, args)
+        return _played(await _run_async(cmd, timeout=30), file_path)
+    
+    except subprocess.TimeoutExpired:
+        return _err("Audio playback timed out")
+    except Exception as e:
+        return _err(f"Failed to play audio: {str(e)}")
+
+async def _extract_audio_impl_async(args: Dict[str, Any]) -> Dict[str, Any]:
+    """Audio extraction implementation, awaiting ffmpeg"""
+    file_path = args.get("file")
+    if not file_path:
+        return _err("Missing required argument: file")
+    
+    try:
+        if not os.path.exists(file_path):
+            return _err(f"Media file not found: {file_path}")
+        
+        return _extracted(await _run_async(_extract_command(args), timeout=60), args)
+    
+    except subprocess.TimeoutExpired:
+        return _err("Audio extraction timed out")
+    except Exception as e:
+        return _err(f"Failed to extract audio: {str(e)}")
+
+# Action dispatch tables for audio_control and media_processor
+_AUDIO_HANDLERS = {
+    "record": _record_audio_impl,
+    "play": _play_audio_impl,
+    "speak": _speak_text_impl,
+    "transcribe": _transcribe_audio_impl,
+    "transcribe_stream": _transcribe_stream_impl,
+    "list_devices": _list_audio_devices_impl,
+    "set_volume": _set_volume_impl,
+    "get_volume": _get_volume_impl,
+}
+
+_MEDIA_HANDLERS = {
+    "transcribe": _transcribe_media_impl,
+    "analyze_scene": _analyze_scene_impl,
+    "detect_faces": _detect_faces_impl,
+    "detect_objects": _detect_objects_impl,
+    "extract_audio": _extract_audio_impl,
+}
+
+_AUDIO_HANDLERS_ASYNC = {
+    "record": _record_audio_impl_async,
+    "play": _play_audio_impl_async,
+}
+
+_MEDIA_HANDLERS_ASYNC = {
+    "extract_audio": _extract_audio_impl_async,
+}
 
 # Legacy function aliases for backward compatibility
 def record_audio(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
@@ -643,7 +1088,7 @@ def list_audio_devices(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
 
 def adjust_mic_gain(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use audio_control instead"""
-    return {"success": False, "result": None, "error": "Microphone gain adjustment not yet implemented"}
+    return _err("Microphone gain adjustment not yet implemented")
 
 def adjust_speaker_volume(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use audio_control instead"""
@@ -2,9 +2,48 @@
 Automation Tools - Consolidated UI interaction and automation sequences for AI agents
 Provides unified mouse, keyboard, and automation control for computer use agents.
 """
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from functools import lru_cache
+import ctypes
+import math
+import platform
+import threading
 import time
-import json
+import orjson
+
+# Platform never changes at runtime; uname() once instead of on every call
+_SYSTEM = platform.system()
+
+# Imported once here rather than inside every action; None when pyautogui is
+# missing or cannot reach a display, in which case each action reports it
+try:
+    import pyautogui
+    pyautogui.FAILSAFE = True
+except Exception:
+    pyautogui = None
+
+# Screen bounds used to validate coordinates; re-queried from the display
+# server at most every _SCREEN_SIZE_TTL seconds to pick up resolution changes
+_SCREEN_SIZE_TTL = 5.0
+_screen_size: Tuple[float, Tuple[int, int]] = (0.0, (0, 0))
+
+# Active macro recording: pynput listeners appending (elapsed, kind, ...) tuples
+# to a bounded deque from their own threads; None when not recording
+_recording: Optional[Dict[str, Any]] = None
+_recording_lock = threading.Lock()
+# pyautogui names of recorded modifier keys, which combine with the next key into a hotkey
+_MODIFIER_KEYS = frozenset(("ctrl", "shift", "alt", "altgr", "command", "win"))
+
+def _get_screen_size(ttl: float = _SCREEN_SIZE_TTL) -> Tuple[int, int]:
+    """Return (width, height) of the screen, cached for ttl seconds"""
+    global _screen_size
+    fetched_at, size = _screen_size
+    now = time.monotonic()
+    if not fetched_at or now - fetched_at >= ttl:
+        size = tuple(pyautogui.size())
+        _screen_size = (now, size)
+    return size
 
 def interact(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Universal UI interaction - replaces click_at, type_text, scroll, hotkey_press, drag_to, move_mouse, key_press, double_click, right_click
@@ -29,30 +68,14 @@ def interact(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     action = args["action"]
     
     try:
-        if action == "click":
-            return _click_impl(args)
-        elif action == "double_click":
-            return _double_click_impl(args)
-        elif action == "right_click":
-            return _right_click_impl(args)
-        elif action == "type":
-            return _type_text_impl(args)
-        elif action == "scroll":
-            return _scroll_impl(args)
-        elif action == "hotkey":
-            return _hotkey_impl(args)
-        elif action == "drag":
-            return _drag_impl(args)
-        elif action == "move":
-            return _move_mouse_impl(args)
-        elif action == "key":
-            return _key_press_impl(args)
-        else:
+        handler = _INTERACT_HANDLERS.get(action)
+        if handler is None:
             return {
                 "success": False,
                 "result": None,
                 "error": f"Unknown action: {action}. Use: click, double_click, right_click, type, scroll, hotkey, drag, move, key"
             }
+        return handler(args)
     
     except Exception as e:
         return {"success": False, "result": None, "error": f"Interaction failed: {str(e)}"}
@@ -63,7 +86,8 @@ def automation_sequence(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     Args:
         action (str): Action to perform - 'execute', 'record', 'stop_record', 'save_macro', 'load_macro'
         steps (list): List of interaction steps to execute
-        macro_name (str): Name of macro to save/load
+        macro_name (str): Name of macro to save/load (or to save on 'stop_record')
+        max_events (int): Most recent events kept while recording (default: 100000)
         delay (float): Delay between steps (default: 0.1)
         
     Returns:
@@ -75,22 +99,14 @@ def automation_sequence(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     action = args["action"]
     
     try:
-        if action == "execute":
-            return _execute_sequence_impl(args)
-        elif action == "record":
-            return _start_recording_impl(args)
-        elif action == "stop_record":
-            return _stop_recording_impl(args)
-        elif action == "save_macro":
-            return _save_macro_impl(args)
-        elif action == "load_macro":
-            return _load_macro_impl(args)
-        else:
+        handler = _SEQUENCE_HANDLERS.get(action)
+        if handler is None:
             return {
                 "success": False,
                 "result": None,
                 "error": f"Unknown action: {action}. Use: execute, record, stop_record, save_macro, load_macro"
             }
+        return handler(args)
     
     except Exception as e:
         return {"success": False, "result": None, "error": f"Automation sequence failed: {str(e)}"}
@@ -98,10 +114,10 @@ def automation_sequence(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
 # Interaction Implementation Helpers
 def _click_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Click implementation"""
+    if pyautogui is None:
+        return {"success": False, "result": None, "error": "UI automation requires pyautogui (pip install pyautogui)"}
+    
     try:
-        import pyautogui
-        pyautogui.FAILSAFE = True
-        
         x = args.get("x")
         y = args.get("y")
         if x is None or y is None:
@@ -112,7 +128,7 @@ def _click_impl(args: Dict[str, Any]) -> Dict[str, Any]:
         duration = args.get("duration", 0.1)
         
         # Validate coordinates
-        screen_width, screen_height = pyautogui.size()
+        screen_width, screen_height = _get_screen_size()
         if not (0 <= x <= screen_width and 0 <= y <= screen_height):
             return {
                 "success": False,
@@ -136,27 +152,24 @@ def _click_impl(args: Dict[str, Any]) -> Dict[str, Any]:
             "error": None
         }
     
-    except ImportError:
-        return {"success": False, "result": None, "error": "UI automation requires pyautogui (pip install pyautogui)"}
     except Exception as e:
         return {"success": False, "result": None, "error": f"Click failed: {str(e)}"}
 
 def _double_click_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Double click implementation"""
-    args["clicks"] = 2
-    args["duration"] = 0.05  # Faster for double click
-    return _click_impl(args)
+    # Copied: args may be a step shared with the macro cache
+    return _click_impl({**args, "clicks": 2, "duration": 0.05})  # Faster for double click
 
 def _right_click_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Right click implementation"""
-    args["button"] = "right"
-    return _click_impl(args)
+    return _click_impl({**args, "button": "right"})
 
 def _type_text_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Type text implementation"""
+    if pyautogui is None:
+        return {"success": False, "result": None, "error": "Text typing requires pyautogui (pip install pyautogui)"}
+    
     try:
-        import pyautogui
-        
         text = args.get("text")
         if not text:
             return {"success": False, "result": None, "error": "Missing required argument: text"}
@@ -178,16 +191,15 @@ def _type_text_impl(args: Dict[str, Any]) -> Dict[str, Any]:
             "error": None
         }
     
-    except ImportError:
-        return {"success": False, "result": None, "error": "Text typing requires pyautogui (pip install pyautogui)"}
     except Exception as e:
         return {"success": False, "result": None, "error": f"Type text failed: {str(e)}"}
 
 def _scroll_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Scroll implementation"""
+    if pyautogui is None:
+        return {"success": False, "result": None, "error": "Scrolling requires pyautogui (pip install pyautogui)"}
+    
     try:
-        import pyautogui
-        
         direction = args.get("direction", "down")
         amount = args.get("amount", 3)
         x = args.get("x")
@@ -220,16 +232,15 @@ def _scroll_impl(args: Dict[str, Any]) -> Dict[str, Any]:
             "error": None
         }
     
-    except ImportError:
-        return {"success": False, "result": None, "error": "Scrolling requires pyautogui (pip install pyautogui)"}
     except Exception as e:
         return {"success": False, "result": None, "error": f"Scroll failed: {str(e)}"}
 
 def _hotkey_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Hotkey implementation"""
+    if pyautogui is None:
+        return {"success": False, "result": None, "error": "Hotkeys require pyautogui (pip install pyautogui)"}
+    
     try:
-        import pyautogui
-        
         keys = args.get("keys")
         if not keys:
             return {"success": False, "result": None, "error": "Missing required argument: keys"}
@@ -257,16 +268,15 @@ def _hotkey_impl(args: Dict[str, Any]) -> Dict[str, Any]:
             "error": None
         }
     
-    except ImportError:
-        return {"success": False, "result": None, "error": "Hotkeys require pyautogui (pip install pyautogui)"}
     except Exception as e:
         return {"success": False, "result": None, "error": f"Hotkey failed: {str(e)}"}
 
 def _drag_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Drag implementation"""
+    if pyautogui is None:
+        return {"success": False, "result": None, "error": "Dragging requires pyautogui (pip install pyautogui)"}
+    
     try:
-        import pyautogui
-        
         x = args.get("x")
         y = args.get("y")
         to_x = args.get("to_x")
@@ -278,18 +288,19 @@ def _drag_impl(args: Dict[str, Any]) -> Dict[str, Any]:
         duration = args.get("duration", 0.5)
         button = args.get("button", "left")
         
-        # Validate coordinates
-        screen_width, screen_height = pyautogui.size()
-        for coord_x, coord_y in [(x, y), (to_x, to_y)]:
-            if not (0 <= coord_x <= screen_width and 0 <= coord_y <= screen_height):
-                return {
-                    "success": False,
-                    "result": None,
-                    "error": f"Coordinates ({coord_x}, {coord_y}) outside screen bounds"
-                }
+        # Validate both endpoints at once
+        screen_width, screen_height = _get_screen_size()
+        if min(x, y, to_x, to_y) < 0 or max(x, to_x) > screen_width or max(y, to_y) > screen_height:
+            coord_x, coord_y = (x, y) if not (0 <= x <= screen_width and 0 <= y <= screen_height) else (to_x, to_y)
+            return {
+                "success": False,
+                "result": None,
+                "error": f"Coordinates ({coord_x}, {coord_y}) outside screen bounds"
+            }
         
         # Perform drag
-        pyautogui.drag(to_x - x, to_y - y, duration=duration, button=button)
+        dx, dy = to_x - x, to_y - y
+        pyautogui.drag(dx, dy, duration=duration, button=button)
         
         return {
             "success": True,
@@ -297,7 +308,7 @@ def _drag_impl(args: Dict[str, Any]) -> Dict[str, Any]:
                 "action": "drag",
                 "from": {"x": x, "y": y},
                 "to": {"x": to_x, "y": to_y},
-                "distance": ((to_x - x) ** 2 + (to_y - y) ** 2) ** 0.5,
+                "distance": math.hypot(dx, dy),
                 "duration": duration,
                 "button": button,
                 "method": "pyautogui"
@@ -305,16 +316,15 @@ def _drag_impl(args: Dict[str, Any]) -> Dict[str, Any]:
             "error": None
         }
     
-    except ImportError:
-        return {"success": False, "result": None, "error": "Dragging requires pyautogui (pip install pyautogui)"}
     except Exception as e:
         return {"success": False, "result": None, "error": f"Drag failed: {str(e)}"}
 
 def _move_mouse_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Move mouse implementation"""
+    if pyautogui is None:
+        return {"success": False, "result": None, "error": "Mouse movement requires pyautogui (pip install pyautogui)"}
+    
     try:
-        import pyautogui
-        
         x = args.get("x")
         y = args.get("y")
         if x is None or y is None:
@@ -323,7 +333,7 @@ def _move_mouse_impl(args: Dict[str, Any]) -> Dict[str, Any]:
         duration = args.get("duration", 0.2)
         
         # Validate coordinates
-        screen_width, screen_height = pyautogui.size()
+        screen_width, screen_height = _get_screen_size()
         if not (0 <= x <= screen_width and 0 <= y <= screen_height):
             return {
                 "success": False,
@@ -349,16 +359,15 @@ def _move_mouse_impl(args: Dict[str, Any]) -> Dict[str, Any]:
             "error": None
         }
     
-    except ImportError:
-        return {"success": False, "result": None, "error": "Mouse movement requires pyautogui (pip install pyautogui)"}
     except Exception as e:
         return {"success": False, "result": None, "error": f"Mouse movement failed: {str(e)}"}
 
 def _key_press_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Key press implementation"""
+    if pyautogui is None:
+        return {"success": False, "result": None, "error": "Key press requires pyautogui (pip install pyautogui)"}
+    
     try:
-        import pyautogui
-        
         key = args.get("key")
         if not key:
             return {"success": False, "result": None, "error": "Missing required argument: key"}
@@ -381,8 +390,6 @@ def _key_press_impl(args: Dict[str, Any]) -> Dict[str, Any]:
             "error": None
         }
     
-    except ImportError:
-        return {"success": False, "result": None, "error": "Key press requires pyautogui (pip install pyautogui)"}
     except Exception as e:
         return {"success": False, "result": None, "error": f"Key press failed: {str(e)}"}
 
@@ -398,37 +405,51 @@ def _execute_sequence_impl(args: Dict[str, Any]) -> Dict[str, Any]:
             return {"success": False, "result": None, "error": "Steps must be a list"}
         
         delay = args.get("delay", 0.1)
+        stop_on_error = args.get("stop_on_error", True)
         results = []
         
-        for i, step in enumerate(steps):
-            if not isinstance(step, dict):
-                return {"success": False, "result": None, "error": f"Step {i} must be a dictionary"}
-            
-            # Execute the step using interact function
-            step_result = interact(args=step)
-            results.append({
-                "step": i,
-                "action": step.get("action", "unknown"),
-                "success": step_result["success"],
-                "error": step_result.get("error")
-            })
-            
-            # Stop on first failure if specified
-            if not step_result["success"] and args.get("stop_on_error", True):
-                return {
-                    "success": False,
-                    "result": {
-                        "completed_steps": i,
-                        "total_steps": len(steps),
-                        "results": results,
-                        "method": "sequence_execution"
-                    },
-                    "error": f"Step {i} failed: {step_result['error']}"
-                }
-            
-            # Delay between steps
-            if delay > 0 and i < len(steps) - 1:
-                time.sleep(delay)
+        # Steps start every `delay` seconds on a monotonic clock, so a step that
+        # takes longer than the gap uses it up instead of adding to it
+        high_res_timer = _SYSTEM == "Windows" and delay > 0
+        if high_res_timer:
+            # 1 ms sleep resolution instead of the default ~15.6 ms timer tick
+            ctypes.windll.winmm.timeBeginPeriod(1)
+        try:
+            start = time.monotonic()
+            for i, step in enumerate(steps):
+                if not isinstance(step, dict):
+                    return {"success": False, "result": None, "error": f"Step {i} must be a dictionary"}
+                
+                # Execute the step the way interact would
+                ok, error = _interact_fast(step.get("action"), step)
+                results.append({
+                    "step": i,
+                    "action": step.get("action", "unknown"),
+                    "success": ok,
+                    "error": error
+                })
+                
+                # Stop on first failure if specified
+                if not ok and stop_on_error:
+                    return {
+                        "success": False,
+                        "result": {
+                            "completed_steps": i,
+                            "total_steps": len(steps),
+                            "results": results,
+                            "method": "sequence_execution"
+                        },
+                        "error": f"Step {i} failed: {error}"
+                    }
+                
+                # Wait out whatever is left of this step's slot
+                if delay > 0 and i < len(steps) - 1:
+                    remaining = start + (i + 1) * delay - time.monotonic()
+                    if remaining > 0:
+                        time.sleep(remaining)
+        finally:
+            if high_res_timer:
+                ctypes.windll.winmm.timeEndPeriod(1)
         
         successful_steps = sum(1 for r in results if r["success"])
         
@@ -447,32 +468,193 @@ def _execute_sequence_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"success": False, "result": None, "error": f"Sequence execution failed: {str(e)}"}
 
+def _interact_fast(action: Optional[str], args: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+    """interact() for the sequence executor, returning only (success, error)"""
+    if "action" not in args:
+        return False, "Missing required argument: action"
+    
+    handler = _INTERACT_HANDLERS.get(action)
+    if handler is None:
+        return False, f"Unknown action: {action}. Use: click, double_click, right_click, type, scroll, hotkey, drag, move, key"
+    try:
+        result = handler(args)
+    except Exception as e:
+        return False, f"Interaction failed: {str(e)}"
+    return result["success"], result["error"]
+
 def _start_recording_impl(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Start macro recording implementation"""
+    """Start macro recording implementation
+    
+    Clicks, scrolls, key presses and modifier releases are captured by pynput
+    listener threads into a deque of at most max_events entries; the oldest
+    are dropped first.
+    """
+    global _recording
+    try:
+        from pynput import keyboard, mouse
+    except ImportError:
+        return {"success": False, "result": None, "error": "Macro recording requires pynput (pip install pynput)"}
+    
     try:
-        # Macro recording would require event listeners
-        # This is a placeholder implementation
+        with _recording_lock:
+            if _recording is not None:
+                return {"success": False, "result": None, "error": "Macro recording already in progress"}
+            
+            max_events = args.get("max_events", 100000)
+            events = deque(maxlen=max_events)
+            start = time.perf_counter()
+            
+            # Only modifier releases are kept, to tell chords from lone taps
+            modifiers = frozenset(
+                getattr(keyboard.Key, name) for name in (
+                    "ctrl", "ctrl_l", "ctrl_r", "shift", "shift_l", "shift_r", "alt",
+                    "alt_l", "alt_r", "alt_gr", "cmd", "cmd_l", "cmd_r"
+                ) if hasattr(keyboard.Key, name)
+            )
+            
+            def on_press(key):
+                events.append((time.perf_counter() - start, "key", key))
+            
+            def on_release(key):
+                if key in modifiers:
+                    events.append((time.perf_counter() - start, "release", key))
+            
+            def on_click(x, y, button, pressed):
+                if pressed:
+                    events.append((time.perf_counter() - start, "click", x, y, button.name))
+            
+            def on_scroll(x, y, dx, dy):
+                events.append((time.perf_counter() - start, "scroll", x, y, dy))
+            
+            listeners = (
+                keyboard.Listener(on_press=on_press, on_release=on_release),
+                mouse.Listener(on_click=on_click, on_scroll=on_scroll)
+            )
+            started = []
+            try:
+                for listener in listeners:
+                    listener.start()
+                    started.append(listener)
+            except Exception:
+                for listener in started:
+                    listener.stop()
+                raise
+            
+            _recording = {"listeners": listeners, "events": events, "start": start, "max_events": max_events}
+        
         return {
-            "success": False,
-            "result": None,
-            "error": "Macro recording requires additional setup (event listeners, input monitoring)"
+            "success": True,
+            "result": {
+                "recording": True,
+                "max_events": max_events,
+                "method": "pynput_listener"
+            },
+            "error": None
         }
     
     except Exception as e:
         return {"success": False, "result": None, "error": f"Recording start failed: {str(e)}"}
 
 def _stop_recording_impl(args: Dict[str, Any]) -> Dict[str, Any]:
-    """Stop macro recording implementation"""
+    """Stop macro recording implementation
+    
+    Returns the captured events as interact steps; with macro_name they are
+    also saved as a macro.
+    """
+    global _recording
     try:
-        return {
-            "success": False,
-            "result": None,
-            "error": "Macro recording not yet implemented"
+        with _recording_lock:
+            if _recording is None:
+                return {"success": False, "result": None, "error": "No macro recording in progress"}
+            recording, _recording = _recording, None
+        
+        for listener in recording["listeners"]:
+            listener.stop()
+        
+        events = list(recording["events"])
+        steps = _recorded_steps(events)
+        result = {
+            "steps": steps,
+            "steps_count": len(steps),
+            "duration": time.perf_counter() - recording["start"],
+            "truncated": len(events) == recording["max_events"],
+            "method": "pynput_listener"
         }
+        
+        macro_name = args.get("macro_name")
+        if macro_name and steps:
+            saved = _save_macro_impl({"macro_name": macro_name, "steps": steps})
+            if not saved["success"]:
+                return saved
+            result["file_path"] = saved["result"]["file_path"]
+        
+        return {"success": True, "result": result, "error": None}
     
     except Exception as e:
         return {"success": False, "result": None, "error": f"Recording stop failed: {str(e)}"}
 
+def _recorded_steps(events: List[Tuple[Any, ...]]) -> List[Dict[str, Any]]:
+    """Convert recorded events into interact steps, folding chords into hotkeys
+    
+    A key pressed while modifiers are held becomes one hotkey step such as
+    ["ctrl", "c"]. A modifier released without another key in between is a
+    plain key step; releases whose press fell out of the deque are ignored.
+    """
+    steps = []
+    held: Dict[str, List[Any]] = {}  # modifier -> [press time, used in a chord]
+    for event in events:
+        kind = event[1]
+        if kind not in ("key", "release"):
+            # A modifier held across a click is not replayed as a tap after it
+            for state in held.values():
+                state[1] = True
+            steps.append(_recorded_event_step(event))
+            continue
+        name = _pynput_key_name(event[2])
+        if kind == "release":
+            state = held.pop(name, None)
+            if state is not None and not state[1]:
+                steps.append({"action": "key", "key": name, "at": state[0]})
+        elif name in _MODIFIER_KEYS:
+            held.setdefault(name, [round(event[0], 4), False])  # ignore auto-repeat
+        elif held:
+            for state in held.values():
+                state[1] = True
+            steps.append({"action": "hotkey", "keys": [*held, name], "at": round(event[0], 4)})
+        else:
+            steps.append(_recorded_event_step(event))
+    # Modifiers still down when recording stopped
+    steps.extend({"action": "key", "key": name, "at": at} for name, (at, used) in held.items() if not used)
+    return steps
+
+def _recorded_event_step(event: Tuple[Any, ...]) -> Dict[str, Any]:
+    """Convert a recorded (elapsed, kind, ...) event into an interact step"""
+    at, kind = round(event[0], 4), event[1]
+    if kind == "click":
+        _, _, x, y, button = event
+        return {"action": "click", "x": x, "y": y, "button": button, "at": at}
+    if kind == "scroll":
+        _, _, x, y, dy = event
+        return {"action": "scroll", "direction": "up" if dy > 0 else "down", "amount": abs(dy), "x": x, "y": y, "at": at}
+    return {"action": "key", "key": _pynput_key_name(event[2]), "at": at}
+
+def _pynput_key_name(key: Any) -> str:
+    """pyautogui key name for a pynput key, e.g. Key.ctrl_l -> 'ctrl', Key.page_down -> 'pagedown'"""
+    char = getattr(key, "char", None)
+    if char is not None:
+        # With ctrl held some platforms report the control character, e.g. ctrl+c as '\x03'
+        if "\x01" <= char <= "\x1a":
+            return chr(ord(char) + 96)
+        return char
+    name = getattr(key, "name", None)
+    if name is None:
+        return str(key)
+    if name.startswith("cmd"):
+        return "command" if _SYSTEM == "Darwin" else "win"
+    if name.endswith(("_l", "_r")):
+        name = name[:-2]
+    return name.replace("_", "")
+
 def _save_macro_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     """Save macro implementation"""
     try:
@@ -490,7 +672,8 @@ def _save_macro_impl(args: Dict[str, Any]) -> Dict[str, Any]:
         import tempfile
         
         macro_dir = os.path.join(tempfile.gettempdir(), "que_core_macros")
-        os.makedirs(macro_dir, exist_ok=True)
+        # Private to this user: macros replay input, so others must not plant them
+        os.makedirs(macro_dir, mode=0o700, exist_ok=True)
         
         macro_file = os.path.join(macro_dir, f"{macro_name}.json")
         
@@ -501,8 +684,9 @@ def _save_macro_impl(args: Dict[str, Any]) -> Dict[str, Any]:
             "version": "1.0"
         }
         
-        with open(macro_file, 'w') as f:
-            json.dump(macro_data, f, indent=2)
+        with open(macro_file, 'wb') as f:
+            f.write(orjson.dumps(macro_data, option=orjson.OPT_INDENT_2))
+        _read_macro.cache_clear()
         
         return {
             "success": True,
@@ -533,18 +717,20 @@ def _load_macro_impl(args: Dict[str, Any]) -> Dict[str, Any]:
         macro_dir = os.path.join(tempfile.gettempdir(), "que_core_macros")
         macro_file = os.path.join(macro_dir, f"{macro_name}.json")
         
-        if not os.path.exists(macro_file):
+        try:
+            stat = os.stat(macro_file)
+        except FileNotFoundError:
             return {"success": False, "result": None, "error": f"Macro '{macro_name}' not found"}
         
-        with open(macro_file, 'r') as f:
-            macro_data = json.load(f)
+        macro_data = _read_macro(macro_file, stat.st_mtime_ns, stat.st_size)
+        steps = macro_data.get("steps", [])
         
         return {
             "success": True,
             "result": {
                 "macro_name": macro_name,
-                "steps": macro_data.get("steps", []),
-                "steps_count": len(macro_data.get("steps", [])),
+                "steps": list(steps),
+                "steps_count": len(steps),
                 "created": macro_data.get("created"),
                 "loaded": True,
                 "method": "file_load"
@@ -555,6 +741,38 @@ def _load_macro_impl(args: Dict[str, Any]) -> Dict[str, Any]:
     except Exception as e:
         return {"success": False, "result": None, "error": f"Macro load failed: {str(e)}"}
 
+@lru_cache(maxsize=128)
+def _read_macro(macro_file: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parsed macro file, cached per (path, mtime, size) so a rewritten file is re-read
+    
+    The size catches rewrites within the filesystem's mtime granularity, and
+    _save_macro_impl clears the cache outright. The returned dict (and its
+    steps) is shared between calls and must not be modified.
+    """
+    with open(macro_file, 'rb') as f:
+        return orjson.loads(f.read())
+
+# Action dispatch tables for interact and automation_sequence
+_INTERACT_HANDLERS = {
+    "click": _click_impl,
+    "double_click": _double_click_impl,
+    "right_click": _right_click_impl,
+    "type": _type_text_impl,
+    "scroll": _scroll_impl,
+    "hotkey": _hotkey_impl,
+    "drag": _drag_impl,
+    "move": _move_mouse_impl,
+    "key": _key_press_impl,
+}
+
+_SEQUENCE_HANDLERS = {
+    "execute": _execute_sequence_impl,
+    "record": _start_recording_impl,
+    "stop_record": _stop_recording_impl,
+    "save_macro": _save_macro_impl,
+    "load_macro": _load_macro_impl,
+}
+
 # Legacy function aliases for backward compatibility
 def click_at(*, args: Dict[str, Any] = None) -> Dict[str, Any]:
     """Legacy function - use interact instead"""
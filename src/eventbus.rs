@@ -0,0 +1,28 @@
+//! Event bus hot path - synchronous subscriber dispatch
+//! Runs the per-event handler loop without Python interpreter overhead
+
+use pyo3::exceptions::PyException;
+use pyo3::prelude::*;
+use pyo3::types::PyTuple;
+
+/// Call every handler in `handlers` with `event`, continuing past failures.
+/// Returns (index, exception) pairs for the handlers that raised an Exception;
+/// anything that is not an Exception subclass (KeyboardInterrupt, SystemExit)
+/// is propagated immediately.
+#[pyfunction]
+pub fn rust_dispatch_sync(
+    py: Python<'_>,
+    handlers: &Bound<'_, PyTuple>,
+    event: &Bound<'_, PyAny>,
+) -> PyResult<Vec<(usize, PyObject)>> {
+    let mut errors = Vec::new();
+    for (index, handler) in handlers.iter().enumerate() {
+        if let Err(err) = handler.call1((event.clone(),)) {
+            if !err.is_instance_of::<PyException>(py) {
+                return Err(err);
+            }
+            errors.push((index, err.into_value(py).into_py(py)));
+        }
+    }
+    Ok(errors)
+}
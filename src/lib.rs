@@ -9,6 +9,7 @@ mod context;
 mod utils;
 mod network;
 mod shell;
+mod eventbus;
 
 // Re-export the functions we want to expose
 use system::{rust_system_query, rust_system_control, rust_process_manager};
@@ -16,6 +17,7 @@ use context::{rust_context_get, rust_context_capture};
 use utils::{rust_read_file, rust_write_file, rust_list_files, rust_ping_host, rust_run_command, rust_check_internet, rust_file_manager, rust_file_search};
 use network::{rust_network_tools, rust_web_browser};
 use shell::{rust_shell_execute, rust_environment_manager};
+use eventbus::rust_dispatch_sync;
 
 // Legacy function aliases for backward compatibility
 #[pyfunction]
@@ -86,5 +88,8 @@ fn que_core_engine(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // Command execution
     m.add_function(wrap_pyfunction!(rust_run_command, m)?)?;
     
+    // Event bus dispatch
+    m.add_function(wrap_pyfunction!(rust_dispatch_sync, m)?)?;
+    
     Ok(())
 }